@@ -0,0 +1,199 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Batch renderer: finds every Scene subclass in the project and renders them
+in parallel. A scene is skipped when its source (including the local modules
+it imports), its asset files and the render config all hash to the same value
+as the last successful render and that output file still exists.
+
+    python batch_render.py                 # everything, high quality
+    python batch_render.py -q l -j 8       # low quality, 8 workers
+    python batch_render.py -k Meru --force # only Meru scenes, ignore the cache
+    python batch_render.py --draft         # quick previews (see draft_mode.py)
+"""
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from scene_modules import ROOT, asset_paths, load_module, local_dependencies, scene_index
+
+MANIFEST_NAME = "batch_manifest.json"
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+# --- DISCOVERY ---
+
+def discover_scenes(root=ROOT):
+    """[(file path, class name)] for every Scene subclass defined in the project files."""
+    # Static scan: neither manim nor the scene modules are imported here
+    return scene_index(root)
+
+
+# --- HASHING ---
+
+def _hash_file(digest, path):
+    digest.update(str(Path(path).name).encode())
+    if Path(path).is_file():
+        digest.update(Path(path).read_bytes())
+    else:
+        digest.update(b"<missing>")
+
+
+def render_config(quality, draft=False):
+    import manim
+    return {"quality": QUALITIES[quality], "manim": manim.__version__, "draft": draft}
+
+
+def scene_hash(path, scene_name, config):
+    digest = hashlib.sha256()
+    digest.update(scene_name.encode())
+    for dependency in local_dependencies(path):
+        _hash_file(digest, dependency)
+    for asset in asset_paths(path):
+        _hash_file(digest, asset)
+    digest.update(json.dumps(config, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def load_manifest(media_dir):
+    path = Path(media_dir) / MANIFEST_NAME
+    if path.is_file():
+        return json.loads(path.read_text())
+    return {}
+
+
+def save_manifest(media_dir, manifest):
+    path = Path(media_dir) / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so an interrupted run never leaves a half-written manifest
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+# --- RENDERING ---
+
+def render_scene(path, scene_name, quality, media_dir, preview=False, draft=False):
+    """Render one scene in this process; returns the output movie path."""
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    from manim import tempconfig
+
+    module = load_module(path)
+    scene_cls = getattr(module, scene_name)
+    options = {
+        "quality": QUALITIES[quality],
+        "media_dir": str(media_dir),
+        "preview": preview,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }
+    from glyph_store import install_glyph_store
+    install_glyph_store()
+
+    if draft:
+        from draft_mode import DRAFT_CONFIG, draft as draft_scene
+        scene_cls = draft_scene(scene_cls)
+        options.update(DRAFT_CONFIG)
+
+    with tempconfig(options):
+        scene = scene_cls()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def _render_job(job):
+    from glyph_store import glyph_store
+
+    path, scene_name, quality, media_dir, draft = job
+    # Workers are reused: count only this job's lookups
+    store = glyph_store()
+    if store is not None:
+        store.reset_stats()
+    t0 = time.perf_counter()
+    output = render_scene(path, scene_name, quality, media_dir, draft=draft)
+    return output, time.perf_counter() - t0, store.stats() if store is not None else None
+
+
+def batch_render(quality="h", workers=None, media_dir=None, pattern=None, force=False, draft=False):
+    media_dir = Path(media_dir or ROOT / "media")
+    config = render_config(quality, draft)
+    manifest = load_manifest(media_dir)
+
+    jobs = {}
+    for path, scene_name in discover_scenes():
+        if pattern and pattern.lower() not in scene_name.lower():
+            continue
+        key = "{}::{}{}".format(path.name, scene_name, " [draft]" if draft else "")
+        digest = scene_hash(path, scene_name, config)
+        entry = manifest.get(key)
+        if not force and entry and entry["hash"] == digest and Path(entry["output"]).is_file():
+            print("up to date  ", key)
+            continue
+        jobs[key] = (str(path), scene_name, quality, str(media_dir), draft), digest
+
+    failures = 0
+    glyph_hits = glyph_misses = 0
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=ctx) as pool:
+        futures = {pool.submit(_render_job, job): key for key, (job, _) in jobs.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                output, seconds, glyphs = future.result()
+            except Exception as error:
+                failures += 1
+                print("FAILED      ", key, repr(error))
+                continue
+            if glyphs is None:
+                print("rendered    ", key, "({:.1f}s)".format(seconds))
+            else:
+                glyph_hits += glyphs["hits"]
+                glyph_misses += glyphs["misses"]
+                print("rendered    ", key, "({:.1f}s, glyph store {:.0%} of {})".format(
+                    seconds, glyphs["hit_rate"], glyphs["hits"] + glyphs["misses"]))
+            manifest[key] = {"hash": jobs[key][1], "output": output, "rendered_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+            # Save after every success so a crash keeps the finished work
+            save_manifest(media_dir, manifest)
+
+    if glyph_hits + glyph_misses:
+        print("glyph store: {} hits / {} lookups ({:.0%})".format(
+            glyph_hits, glyph_hits + glyph_misses, glyph_hits / (glyph_hits + glyph_misses)))
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render all MathRize scenes in parallel, skipping unchanged ones.")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-k", "--filter", help="only scenes whose class name contains this text")
+    parser.add_argument("--media-dir", default=None, help="output directory (default: ./media)")
+    parser.add_argument("--force", action="store_true", help="render even if nothing changed")
+    parser.add_argument("--draft", action="store_true", help="low-res preview with capped sizes (also MATHRIZE_DRAFT=1)")
+    args = parser.parse_args(argv)
+
+    draft = args.draft or os.environ.get("MATHRIZE_DRAFT", "") not in ("", "0")
+    failures = batch_render(args.quality, args.workers, args.media_dir, args.filter, args.force, draft)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,248 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Scene benchmark suite: renders every MathRize scene headless at low quality
+and records timing, play/wait counts, mobject counts and peak memory.
+
+    python bench_scenes.py                         # all scenes, all sizes
+    python bench_scenes.py -k Meru -o meru.json    # only matching scenes
+    python bench_scenes.py --compare old.json      # flag regressions
+    python bench_scenes.py --profile media/profiles  # per-play traces (scene_profiler)
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scene_modules import ROOT, load_module
+from scene_profiler import ProfiledScene
+
+# --- BENCHMARK MATRIX ---
+# (file, scene class, size knobs). Every combination of knob values is one case.
+SCENES = [
+    ("meru_prastara.py", "MeruPrastaraCompact", {"n_rows": [5, 10, 20]}),
+    ("meru_epic_reveal.py", "MeruEpicReveal", {"n_rows": [8, 16, 64, 256]}),
+    ("pingala_table.py", "PingalaCinematicTableCentered", {"scroll_lengths": [(7, 8), (10, 12), (16,)]}),
+    ("stock_meru_final.py", "StockMeruFinal", {"steps": [5, 15, 30]}),
+    ("weather_meru.py", "WeatherMeruCone", {"n_paths": [15, 1000, 10000], "cone_steps": [5, 200]}),
+    ("galton_board.py", "GaltonBoardMeru", {"n_balls": [10**4, 10**6, 10**7]}),
+    ("scene3.py", "CinematicCombinatorics", {}),
+    ("scene2_pro.py", "MeruPrastaraPro", {}),
+    ("scene.py", "PingalaDecoding", {}),
+    ("Decoding Flower code", "ChampaMorph", {}),
+]
+
+
+def expand_cases(scenes, pattern=None):
+    cases = []
+    for file_name, scene_name, knobs in scenes:
+        if pattern and pattern.lower() not in scene_name.lower():
+            continue
+        combos = [{}]
+        for knob, values in knobs.items():
+            combos = [dict(combo, **{knob: value}) for combo in combos for value in values]
+        cases.extend((file_name, scene_name, combo) for combo in combos)
+    return cases
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        # Windows: psutil is optional
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 2 ** 20
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def _percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def run_case(file_name, scene_name, knobs, encode=False, profile_dir=None):
+    """Render one scene case in this process and return its measurements."""
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    from manim import tempconfig
+    from glyph_store import glyph_store, install_glyph_store
+
+    # Each case gets a fresh media dir, so compiled glyphs only carry over through the store
+    install_glyph_store()
+    module = load_module(ROOT / file_name)
+    base = getattr(module, scene_name)
+    # Override the size knobs on a throwaway subclass
+    scene_cls = type(scene_name, (base,), dict(knobs))
+    if profile_dir:
+        # One trace per case: "<Scene>[_knob-value...]"
+        suffix = "".join("_{}-{}".format(k, v) for k, v in sorted(knobs.items()))
+        scene_cls = type(scene_name, (ProfiledScene, scene_cls), {
+            "profile": True, "profile_dir": profile_dir, "profile_name": scene_name + suffix.replace(" ", ""),
+        })
+
+    stats = {"play_calls": 0, "wait_calls": 0, "frame_times": [], "family_peak": 0, "depth": 0}
+
+    class BenchScene(scene_cls):
+        def _track_family(self):
+            stats["family_peak"] = max(stats["family_peak"], len(self.get_mobject_family_members()))
+
+        def play(self, *args, **kwargs):
+            # Scene.wait plays a Wait animation: count that as the wait only
+            if stats["depth"]:
+                return super().play(*args, **kwargs)
+            stats["play_calls"] += 1
+            return self._tracked(super().play, *args, **kwargs)
+
+        def wait(self, *args, **kwargs):
+            stats["wait_calls"] += 1
+            return self._tracked(super().wait, *args, **kwargs)
+
+        def _tracked(self, call, *args, **kwargs):
+            stats["depth"] += 1
+            try:
+                result = call(*args, **kwargs)
+            finally:
+                stats["depth"] -= 1
+            self._track_family()
+            return result
+
+    with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+        "quality": "low_quality",
+        "preview": False,
+        "disable_caching": True,
+        "write_to_movie": encode,
+        "media_dir": media_dir,
+        "verbosity": "ERROR",
+        "progress_bar": "none",
+    }):
+        scene = BenchScene()
+
+        # Per-frame cost = one call of renderer.render (update_frame + add_frame)
+        renderer_render = scene.renderer.render
+
+        def timed_render(*args, **kwargs):
+            t0 = time.perf_counter()
+            result = renderer_render(*args, **kwargs)
+            stats["frame_times"].append(time.perf_counter() - t0)
+            return result
+
+        scene.renderer.render = timed_render
+
+        t0 = time.perf_counter()
+        scene.render()
+        wall = time.perf_counter() - t0
+
+    frame_times = stats["frame_times"]
+    frame_total = sum(frame_times)
+    return {
+        "file": file_name,
+        "scene": scene_name,
+        "knobs": knobs,
+        "wall_s": wall,
+        # Everything but frame rendering: construct code, interpolation, setup, encoding
+        "non_frame_s": wall - frame_total,
+        "frames": len(frame_times),
+        "frame_ms_mean": 1000 * frame_total / len(frame_times) if frame_times else None,
+        "frame_ms_p95": 1000 * _percentile(frame_times, 0.95) if frame_times else None,
+        "frame_ms_max": 1000 * max(frame_times) if frame_times else None,
+        "play_calls": stats["play_calls"],
+        "wait_calls": stats["wait_calls"],
+        "mobjects_final": len(scene.mobjects),
+        "family_final": len(scene.get_mobject_family_members()),
+        "family_peak": stats["family_peak"],
+        "peak_rss_mb": peak_rss_mb(),
+        "glyph_store": glyph_store().stats() if glyph_store() is not None else None,
+    }
+
+
+def _run_case_safe(args):
+    file_name, scene_name, knobs, encode, profile_dir = args
+    try:
+        return run_case(file_name, scene_name, knobs, encode, profile_dir)
+    except Exception as error:
+        return {"file": file_name, "scene": scene_name, "knobs": knobs, "error": repr(error)}
+
+
+def run_all(cases, encode=False, profile_dir=None):
+    # One fresh process per case: peak RSS and caches are not shared between cases
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    with ctx.Pool(processes=1, maxtasksperchild=1) as pool:
+        for result in pool.imap(_run_case_safe, [case + (encode, profile_dir) for case in cases]):
+            print(_summary_line(result), flush=True)
+            results.append(result)
+    return results
+
+
+def _case_key(result):
+    return result["scene"], json.dumps(result["knobs"], sort_keys=True)
+
+
+def _summary_line(result):
+    label = "{} {}".format(result["scene"], result["knobs"] or "")
+    if "error" in result:
+        return "{:60s} ERROR {}".format(label, result["error"])
+    return "{:60s} {:8.2f}s  {:5d} frames  {:5d} mobjects  {} MB".format(
+        label, result["wall_s"], result["frames"], result["family_peak"],
+        "?" if result["peak_rss_mb"] is None else round(result["peak_rss_mb"]),
+    )
+
+
+def compare(results, baseline_path, threshold=0.2):
+    """Print cases whose wall time grew by more than `threshold` vs a previous run."""
+    baseline = {_case_key(r): r for r in json.loads(Path(baseline_path).read_text())["results"]}
+    regressions = []
+    for result in results:
+        old = baseline.get(_case_key(result))
+        if not old or "error" in result or "error" in old:
+            continue
+        if result["wall_s"] > old["wall_s"] * (1 + threshold):
+            regressions.append(result)
+            print("REGRESSION {} {}: {:.2f}s -> {:.2f}s".format(
+                result["scene"], result["knobs"], old["wall_s"], result["wall_s"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark MathRize scenes headless at low quality.")
+    parser.add_argument("-k", "--filter", help="only scenes whose class name contains this text")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--encode", action="store_true", help="also encode the movie (slower)")
+    parser.add_argument("--profile", metavar="DIR", help="also write per-play profiles (trace JSON + folded stacks) to DIR")
+    parser.add_argument("--compare", help="previous results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown for --compare")
+    args = parser.parse_args(argv)
+
+    results = run_all(expand_cases(SCENES, args.filter), encode=args.encode, profile_dir=args.profile)
+    Path(args.output).write_text(json.dumps({
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }, indent=2))
+    print("Results written to", args.output)
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
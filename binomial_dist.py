@@ -0,0 +1,114 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import math
+
+import numpy as np
+
+try:
+    from scipy.special import gammaln
+except ImportError:
+    # scipy is optional; math.lgamma over a NumPy array is enough for a few thousand points
+    _lgamma = np.frompyfunc(math.lgamma, 1, 1)
+
+    def gammaln(x):
+        return np.asarray(_lgamma(np.asarray(x, dtype=float)), dtype=float)
+
+
+# --- EXACT BINOMIAL (log space, never overflows) ---
+
+def log_binomial_coefficient(n, k):
+    """log C(n, k) = lgamma(n+1) - lgamma(k+1) - lgamma(n-k+1), vectorized over k."""
+    k = np.asarray(k, dtype=float)
+    return gammaln(n + 1.0) - gammaln(k + 1.0) - gammaln(n - k + 1.0)
+
+
+def log_factorials(n):
+    """log 0!, log 1!, ..., log n! as one cumulative sum (exact indexing for whole grids)."""
+    return np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n + 1)))])
+
+
+def binomial_pmf_grid(n_max, p=0.5):
+    """(n_max + 1, n_max + 1) array: row n holds P(K = k) for K ~ Binomial(n, p), 0 for k > n."""
+    log_fact = log_factorials(n_max)
+    n = np.arange(n_max + 1)[:, None]
+    k = np.arange(n_max + 1)[None, :]
+    inside = k <= n
+    n_minus_k = np.where(inside, n - k, 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p = np.log(p) if p > 0 else -np.inf
+        log_q = np.log1p(-p) if p < 1 else -np.inf
+        log_pmf = log_fact[n] - log_fact[k] - log_fact[n_minus_k] + np.nan_to_num(k * log_p) + np.nan_to_num(n_minus_k * log_q)
+        if p == 0:
+            log_pmf = np.where(k == 0, 0.0, -np.inf)
+        elif p == 1:
+            log_pmf = np.where(k == n, 0.0, -np.inf)
+    return np.where(inside, np.exp(log_pmf), 0.0)
+
+
+def binomial_log_pmf(n, k, p=0.5):
+    k = np.asarray(k, dtype=float)
+    # Clip before lgamma (it has poles at 0, -1, ...); outside cells are masked below
+    k_in = np.clip(k, 0, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_p = np.log(p) if p > 0 else -np.inf
+        log_q = np.log1p(-p) if p < 1 else -np.inf
+        values = log_binomial_coefficient(n, k_in) + k_in * log_p + (n - k_in) * log_q
+    # 0 * log(0) terms (p = 0 or 1) contribute nothing
+    if p == 0:
+        values = np.where(k == 0, 0.0, -np.inf)
+    elif p == 1:
+        values = np.where(k == n, 0.0, -np.inf)
+    return np.where((k >= 0) & (k <= n), values, -np.inf)
+
+
+def binomial_pmf(n, k=None, p=0.5):
+    k = np.arange(n + 1) if k is None else k
+    return np.exp(binomial_log_pmf(n, k, p))
+
+
+# --- NORMAL APPROXIMATION ---
+
+def normal_approx(n, k, p=0.5):
+    """De Moivre-Laplace: N(np, np(1-p)) density at k (k may be fractional)."""
+    mean = n * p
+    var = n * p * (1 - p)
+    k = np.asarray(k, dtype=float)
+    return np.exp(-(k - mean) ** 2 / (2 * var)) / np.sqrt(2 * np.pi * var)
+
+
+def support_window(n, p=0.5, n_sigma=5.0, max_points=None):
+    """
+    Integer k values within n_sigma standard deviations of the mean.
+    With max_points, at most that many evenly spread k (plus the mode),
+    so a plot of N = 10^6 costs the same as N = 10^3.
+    """
+    mean = n * p
+    sigma = math.sqrt(max(n * p * (1 - p), 1e-12))
+    lo = max(0, int(math.floor(mean - n_sigma * sigma)))
+    hi = min(n, int(math.ceil(mean + n_sigma * sigma)))
+    if max_points is None or hi - lo + 1 <= max_points:
+        return np.arange(lo, hi + 1)
+    k = np.unique(np.rint(np.linspace(lo, hi, max_points)).astype(np.int64))
+    return np.union1d(k, [int(round(mean))])
+
+
+def pmf_comparison(n, p=0.5, n_sigma=5.0, max_points=400):
+    """Exact PMF, normal approximation and their difference on the support window."""
+    k = support_window(n, p, n_sigma, max_points)
+    exact = binomial_pmf(n, k, p)
+    normal = normal_approx(n, k, p)
+    error = exact - normal
+    sigma = math.sqrt(max(n * p * (1 - p), 1e-12))
+    return {
+        "n": n,
+        "k": k,
+        "z": (k - n * p) / sigma,
+        "exact": exact,
+        "normal": normal,
+        "error": error,
+        "max_abs_error": float(np.max(np.abs(error))) if len(error) else 0.0,
+    }
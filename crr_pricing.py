@@ -0,0 +1,144 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import math
+
+import numpy as np
+
+from binomial_dist import binomial_log_pmf
+
+try:
+    from scipy.special import ndtr
+except ImportError:
+    _erf = np.frompyfunc(math.erf, 1, 1)
+
+    def ndtr(x):
+        return 0.5 * (1.0 + np.asarray(_erf(np.asarray(x, dtype=float) / math.sqrt(2.0)), dtype=float))
+
+
+# Options per backward-induction block (keeps each block's lattice rows in cache)
+BATCH_BLOCK = 128
+
+
+# --- COX-ROSS-RUBINSTEIN LATTICE ---
+# Node (step i, ups j) of the Meru lattice has price S0 * u^j * d^(i - j), with d = 1/u.
+
+def crr_parameters(sigma, T, N, r=0.0, q=0.0):
+    """dt, up factor u, down factor d, risk-neutral up probability p, one-step discount."""
+    sigma, T, r, q = (np.asarray(v, dtype=float) for v in (sigma, T, r, q))
+    dt = T / N
+    u = np.exp(sigma * np.sqrt(dt))
+    d = 1.0 / u
+    p = (np.exp((r - q) * dt) - d) / (u - d)
+    return dt, u, d, p, np.exp(-r * dt)
+
+
+def _payoff(prices, K, kind):
+    return np.maximum(prices - K, 0.0) if kind == "call" else np.maximum(K - prices, 0.0)
+
+
+def _step_prices(S0, u, d, step):
+    j = np.arange(step + 1)
+    return S0 * u ** j * d ** (step - j)
+
+
+def crr_price(S0, K, T, r=0.0, sigma=0.2, N=200, kind="call", style="european", q=0.0,
+              return_tree=False):
+    """
+    CRR option prices, batched: S0, K, T, r, sigma, q broadcast to one batch shape,
+    and the whole batch goes through one backward induction of N steps.
+    Only the current lattice row (batch x (N+1)) is kept, so memory is O(N) per option.
+    With return_tree=True (small N), also returns every row of node values.
+    """
+    if N < 1:
+        raise ValueError("N must be at least 1 lattice step (got {})".format(N))
+    S0, K, T, r, sigma, q = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (S0, K, T, r, sigma, q)))
+    shape = S0.shape
+    S0, K, T, r, sigma, q = (v.reshape(-1, 1) for v in (S0, K, T, r, sigma, q))
+    _, u, d, p, disc = crr_parameters(sigma, T, N, r, q)
+
+    # Without dividends an American call is never exercised early
+    if style == "american" and kind == "call" and not q.any() and (r >= 0).all():
+        style = "european"
+
+    # European with shared lattice parameters: O(N) sum over terminal nodes in log space
+    if style == "european" and not return_tree and np.ptp(p) == 0 and np.ptp(disc) == 0:
+        k = np.arange(N + 1)
+        weights = np.exp(binomial_log_pmf(N, k, float(p.flat[0])))
+        values = (weights * _payoff(_step_prices(S0, u, d, N), K, kind)).sum(axis=1) * disc.flat[0] ** N
+        return values.reshape(shape)
+
+    # Lattice rows are stored node-major, (N + 1, options), so the shrinking
+    # slice values[:step + 1] stays one contiguous block. Options go through
+    # in blocks of BATCH_BLOCK, so a block's buffers stay in cache.
+    # Discounted weights of the node at j (down move) and at j + 1 (up move)
+    stay, move = disc * (1 - p), disc * p
+    block = len(S0) if return_tree else BATCH_BLOCK
+    prices = np.empty(len(S0))
+    tree = [] if return_tree else None
+    for lo in range(0, len(S0), block):
+        rows = slice(lo, lo + block)
+        prices[rows] = _backward_induction(
+            S0[rows], K[rows], u[rows], d[rows], stay[rows], move[rows], N, kind, style == "american", tree)
+
+    if return_tree:
+        # tree[i] = node values at step i, indexed by ups (same as BinomialLattice)
+        return prices.reshape(shape), [row.T.reshape(shape + (row.shape[0],)) for row in tree[::-1]]
+    return prices.reshape(shape)
+
+
+def _backward_induction(S0, K, u, d, stay, move, N, kind, american, tree=None):
+    """
+    Backward induction for one block of options (column vectors of parameters);
+    returns the block's prices. One value buffer, one price buffer and one
+    scratch buffer are allocated up front and every step updates views of them.
+    """
+    S0, K, u, d, stay, move = (v.reshape(1, -1) for v in (S0, K, u, d, stay, move))
+    prices = np.ascontiguousarray(_step_prices(S0.T, u.T, d.T, N).T)
+    values = _payoff(prices, K, kind)
+    scratch = np.empty_like(values)
+    if tree is not None:
+        tree.append(values.copy())
+    for step in range(N - 1, -1, -1):
+        # In place: v[j] <- disc * ((1 - p) v[j] + p v[j+1])
+        current = values[:step + 1]
+        moved = np.multiply(values[1:step + 2], move, out=scratch[:step + 1])
+        current *= stay
+        current += moved
+        if american:
+            # One step back, in place: price(i, j) = price(i+1, j) * u
+            step_prices = np.multiply(prices[:step + 1], u, out=prices[:step + 1])
+            # Exercise value in the (now free) scratch rows; continuation values
+            # are >= 0, so max(continuation, S - K) is the same as with the payoff
+            exercise = scratch[:step + 1]
+            if kind == "call":
+                np.subtract(step_prices, K, out=exercise)
+            else:
+                np.subtract(K, step_prices, out=exercise)
+            np.maximum(current, exercise, out=current)
+        if tree is not None:
+            tree.append(current.copy())
+    return values[0]
+
+# --- BLACK-SCHOLES REFERENCE ---
+
+def black_scholes(S0, K, T, r=0.0, sigma=0.2, kind="call", q=0.0):
+    S0, K, T, r, sigma, q = (np.asarray(v, dtype=float) for v in (S0, K, T, r, sigma, q))
+    vol = sigma * np.sqrt(T)
+    d1 = (np.log(S0 / K) + (r - q + 0.5 * sigma ** 2) * T) / vol
+    d2 = d1 - vol
+    if kind == "call":
+        return S0 * np.exp(-q * T) * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
+    return K * np.exp(-r * T) * ndtr(-d2) - S0 * np.exp(-q * T) * ndtr(-d1)
+
+
+def convergence(S0, K, T, r=0.0, sigma=0.2, steps=range(1, 201), kind="call", style="european", q=0.0):
+    """(steps, CRR prices, Black-Scholes price) for a convergence plot."""
+    steps = np.asarray(list(steps))
+    if len(steps) and steps.min() < 1:
+        raise ValueError("every N in steps must be at least 1 lattice step")
+    prices = np.array([float(crr_price(S0, K, T, r, sigma, int(n), kind, style, q)) for n in steps])
+    return steps, prices, float(black_scholes(S0, K, T, r, sigma, kind, q))
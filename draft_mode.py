@@ -0,0 +1,186 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Draft preview mode for any scene in the project:
+
+    python launch.py WeatherMeruCone --draft
+    python batch_render.py --draft -k Meru
+    MATHRIZE_DRAFT=1 python launch.py GaltonBoardMeru
+
+A draft render uses DRAFT_CONFIG (480x270, 10 fps), caps the size knobs in
+DRAFT_KNOB_CAPS, compresses every run_time / wait by DRAFT_TIME_SCALE and
+replaces Text / MathTex / Tex / Title with box placeholders of about the same
+size, so layout and timing structure stay the same but nothing goes through
+Pango or LaTeX.
+"""
+import re
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+import manim
+from manim import DOWN, LEFT, RIGHT, UP, WHITE, Line, Rectangle, VGroup
+
+DRAFT_CONFIG = {"pixel_width": 480, "pixel_height": 270, "frame_rate": 10}
+DRAFT_TIME_SCALE = 0.3
+DRAFT_MIN_RUN_TIME = 0.2
+
+# Upper bounds for the size knobs the scenes declare as class attributes
+DRAFT_KNOB_CAPS = {
+    "n_rows": 16,
+    "steps": 10,
+    "cone_steps": 20,
+    "n_paths": 60,
+    "path_steps": 10,
+    "n_balls": 100_000,
+    "n_sample_paths": 3,
+    "scroll_lengths": 10,
+    "mora_count": 12,
+    "max_convergence_steps": 100,
+    "overlay_max_steps": 10_000,
+}
+
+# Rough glyph box at font_size 48, in scene units
+_CHAR_WIDTH = 0.3
+_CHAR_HEIGHT = 0.45
+_LINE_SPACING = 1.4
+
+
+# --- PLACEHOLDER GLYPHS ---
+
+def _visible_tex(tex):
+    # Each command (\frac, \alpha, ...) is about one glyph; braces and scripts are none
+    return re.sub(r"[{}^_\s]", "", re.sub(r"\\[A-Za-z]+|\\.", "x", tex))
+
+
+def _glyph_boxes(text, font_size, color):
+    """One box per visible character, laid out like a line of text."""
+    scale = (font_size or 48) / 48
+    width, height = _CHAR_WIDTH * scale, _CHAR_HEIGHT * scale
+    boxes = VGroup()
+    for row, line in enumerate(text.split("\n")):
+        for col, ch in enumerate(line):
+            if ch.isspace():
+                continue
+            box = Rectangle(width=width * 0.8, height=height, stroke_width=1, stroke_color=color,
+                            fill_color=color, fill_opacity=0.35)
+            boxes.add(box.move_to([col * width, -row * height * _LINE_SPACING, 0]))
+    if not len(boxes):
+        # Keep a size for blank strings so next_to / arrange still work
+        boxes.add(Rectangle(width=width, height=height, stroke_opacity=0, fill_opacity=0))
+    return boxes.center()
+
+
+class DraftText(VGroup):
+    """Stand-in for Text: submobjects are per-character boxes, like Text's glyphs."""
+
+    def __init__(self, text, font_size=48, color=WHITE, **kwargs):
+        super().__init__()
+        self.text = text
+        self.add(*_glyph_boxes(text, font_size, color))
+        self.center()
+
+
+class DraftMathTex(VGroup):
+    """Stand-in for MathTex / Tex: one group of boxes per tex string."""
+
+    def __init__(self, *tex_strings, font_size=48, color=WHITE, arg_separator=" ", **kwargs):
+        super().__init__()
+        self.tex_strings = tex_strings
+        self.tex_string = arg_separator.join(tex_strings)
+        parts = [_glyph_boxes(_visible_tex(tex), font_size, color) for tex in tex_strings]
+        self.add(*parts)
+        self.arrange(RIGHT, buff=_CHAR_WIDTH * (font_size or 48) / 48 * 0.3)
+
+
+class DraftTitle(VGroup):
+    """Stand-in for Title: boxes at the top edge with an underline."""
+
+    def __init__(self, *text_parts, font_size=48, color=WHITE, **kwargs):
+        super().__init__()
+        glyphs = DraftMathTex(*text_parts, font_size=font_size, color=color).to_edge(UP)
+        underline = Line(LEFT, RIGHT, color=color).stretch_to_fit_width(manim.config.frame_width - 2)
+        underline.next_to(glyphs, DOWN, buff=0.1)
+        self.add(glyphs, underline)
+
+
+_PLACEHOLDERS = {
+    "Text": (manim.Text, DraftText),
+    "MathTex": (manim.MathTex, DraftMathTex),
+    "Tex": (manim.Tex, DraftMathTex),
+    "Title": (manim.Title, DraftTitle),
+}
+
+
+@contextmanager
+def draft_glyphs(root=None, modules=()):
+    """
+    Swap the glyph classes for placeholders in every loaded project module
+    (scenes plus helpers such as glyph_cache and pingala_scroller) and in
+    `modules`, then restore.
+    """
+    root = Path(root or Path(__file__).resolve().parent)
+    targets = {}
+    for module in list(sys.modules.values()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and Path(module_file).resolve().parent == root:
+            targets[id(module)] = module
+    for module in modules:
+        targets[id(module)] = module
+
+    swapped = []
+    for module in targets.values():
+        for name, (original, placeholder) in _PLACEHOLDERS.items():
+            if vars(module).get(name) is original:
+                setattr(module, name, placeholder)
+                swapped.append((module, name, original))
+    try:
+        yield
+    finally:
+        for module, name, original in swapped:
+            setattr(module, name, original)
+
+
+# --- SCENES ---
+
+def capped_knobs(scene_cls, caps=DRAFT_KNOB_CAPS):
+    """{knob: capped value} for the knobs of scene_cls that exceed their cap."""
+    knobs = {}
+    for name, cap in caps.items():
+        value = getattr(scene_cls, name, None)
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, int) and value > cap:
+            knobs[name] = cap
+        elif isinstance(value, tuple) and any(isinstance(v, int) and v > cap for v in value):
+            knobs[name] = tuple(min(v, cap) for v in value)
+    return knobs
+
+
+class DraftScene:
+    """Mixin: compresses every animation and wait, and renders with placeholder glyphs."""
+
+    draft_time_scale = DRAFT_TIME_SCALE
+
+    def compile_animations(self, *args, **kwargs):
+        animations = super().compile_animations(*args, **kwargs)
+        for animation in animations:
+            animation.run_time = max(animation.run_time * self.draft_time_scale, DRAFT_MIN_RUN_TIME)
+        return animations
+
+    def render(self, *args, **kwargs):
+        # The scene's own module (and its bases' modules), wherever they live
+        modules = [sys.modules[cls.__module__] for cls in type(self).__mro__ if cls.__module__ in sys.modules]
+        with draft_glyphs(modules=modules):
+            return super().render(*args, **kwargs)
+
+
+def draft(scene_cls, **overrides):
+    """Draft subclass of a scene, with its size knobs capped."""
+    attrs = capped_knobs(scene_cls)
+    attrs["__module__"] = scene_cls.__module__
+    attrs.update(overrides)
+    return type(scene_cls.__name__, (DraftScene, scene_cls), attrs)
@@ -0,0 +1,109 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+
+
+class EdgeSet(VGroup):
+    """
+    Many straight edges from one (E, 2, 3) array of start/end points.
+
+    Instead of one Line per edge, every edge becomes a subpath of a single
+    VMobject. The renderer strokes a VMobject with one colour and opacity, so
+    edges are bucketed by (colour, opacity). With at most opacity_levels
+    distinct opacities each keeps its exact value; beyond that opacities are
+    rounded to opacity_levels - 1 steps of 1 / (opacity_levels - 1), with any
+    non-zero opacity kept at the lowest step rather than dropped. Edges with
+    opacity 0 are not drawn. A lattice with a few thousand edges and per-edge
+    opacities is still only ~opacity_levels mobjects per colour.
+    set_progress(alpha) draws each edge up to its own local progress, which
+    is what GrowEdges animates.
+    """
+
+    def __init__(self, segments, color=WHITE, opacity=1.0, stroke_width=2, order=None,
+                 lag_ratio=0.0, opacity_levels=16, **kwargs):
+        super().__init__(**kwargs)
+        self.segments = np.asarray(segments, dtype=float).reshape(-1, 2, 3)
+        self.edge_stroke_width = stroke_width
+        self.opacity_levels = opacity_levels
+        self.lag_ratio = lag_ratio
+
+        # Per-edge start time in [0, lag_ratio]; default: in array order
+        n_edges = len(self.segments)
+        order = np.arange(n_edges, dtype=float) if order is None else np.asarray(order, dtype=float)
+        span = order.max() - order.min() if n_edges else 0.0
+        self.start_times = lag_ratio * ((order - order.min()) / span if span > 0 else np.zeros(n_edges))
+
+        self.progress = 1.0
+        self.set_edge_style(color, opacity)
+
+    def set_edge_style(self, color=None, opacity=None):
+        """Per-edge colour(s) and opacity(ies): a single value or one per edge."""
+        n_edges = len(self.segments)
+        if color is not None:
+            colors = [color] * n_edges if isinstance(color, (str, ManimColor)) else list(color)
+            self.edge_colors = [ManimColor(c).to_hex() for c in colors]
+        if opacity is not None:
+            self.edge_opacities = np.broadcast_to(np.asarray(opacity, dtype=float), (n_edges,))
+
+        # One child VMobject per (colour, opacity); exact opacities when there are few
+        opacities = np.clip(self.edge_opacities, 0, 1)
+        if len(np.unique(opacities)) > self.opacity_levels:
+            levels = self.opacity_levels - 1
+            quantized = np.maximum(np.rint(opacities * levels), opacities > 0)
+            opacities = quantized / levels
+        bucket_opacities, opacity_ids = np.unique(opacities, return_inverse=True)
+        palette = {}
+        color_ids = np.array([palette.setdefault(c, len(palette)) for c in self.edge_colors], dtype=int)
+        keys = color_ids * len(bucket_opacities) + opacity_ids.reshape(-1)
+
+        self.remove(*self.submobjects)
+        palette = list(palette)
+        for key in np.unique(keys):
+            opacity = bucket_opacities[key % len(bucket_opacities)]
+            if opacity == 0:
+                continue
+            child = VMobject(
+                stroke_color=palette[key // len(bucket_opacities)], stroke_width=self.edge_stroke_width,
+                stroke_opacity=float(opacity), fill_opacity=0,
+            )
+            child.edge_ids = np.flatnonzero(keys == key)
+            self.add(child)
+        return self.set_progress(self.progress)
+
+    def edge_progress(self, alpha):
+        """Local progress of every edge when the whole set is at alpha."""
+        duration = max(1.0 - self.lag_ratio, 1e-9)
+        return np.clip((alpha - self.start_times) / duration, 0.0, 1.0)
+
+    def set_progress(self, alpha):
+        self.progress = alpha
+        local = self.edge_progress(alpha)
+        for child in self.submobjects:
+            ids = child.edge_ids[local[child.edge_ids] > 0]
+            start = self.segments[ids, 0]
+            end = start + local[ids, None] * (self.segments[ids, 1] - start)
+            # Straight cubic per edge: anchors at both ends, handles at 1/3 and 2/3
+            thirds = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+            points = start[:, None, :] + thirds * (end - start)[:, None, :]
+            child.set_points(points.reshape(-1, 3))
+        return self
+
+
+class GrowEdges(Animation):
+    """Create-style animation for an EdgeSet: edges grow from start to end."""
+
+    def __init__(self, edge_set, **kwargs):
+        kwargs.setdefault("introducer", True)
+        super().__init__(edge_set, **kwargs)
+
+    def begin(self):
+        self.mobject.set_progress(0.0)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_progress(self.rate_func(alpha))
@@ -0,0 +1,217 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import itertools
+import os
+import re
+from pathlib import Path
+
+import numpy as np
+
+# Lines parsed per chunk
+CHUNK_LINES = 200_000
+
+# Accepted CSV header names (lower case) for each field
+CSV_COLUMNS = {
+    "member": ("member", "ens", "ensemble", "tech", "id"),
+    "step": ("step", "tau", "lead", "time", "t"),
+    "lat": ("lat", "latitude", "y"),
+    "lon": ("lon", "longitude", "x"),
+}
+
+_ATCF_COORD = re.compile(r"^\s*\d+[NSEW]\s*$")
+
+
+# --- BUFFER ---
+
+class _TrackBuffer:
+    """
+    (members, steps, 2) array of (lon, lat), written in place chunk by chunk.
+    Members and steps get an index the first time they appear. The array is
+    preallocated for the expected size and only reallocated (doubling) when a
+    file has more members or steps than that.
+    """
+
+    def __init__(self, n_members=64, n_steps=256):
+        self.members = {}
+        self.steps = {}
+        self.data = np.full((max(n_members, 1), max(n_steps, 1), 2), np.nan)
+
+    @staticmethod
+    def _index(keys, table):
+        unique, inverse = np.unique(keys, return_inverse=True)
+        ids = np.array([table.setdefault(key, len(table)) for key in unique.tolist()], dtype=np.int64)
+        return ids[inverse.reshape(-1)]
+
+    def _reserve(self, n_members, n_steps):
+        old_m, old_s, _ = self.data.shape
+        if n_members <= old_m and n_steps <= old_s:
+            return
+        new_m = old_m if n_members <= old_m else max(n_members, 2 * old_m)
+        new_s = old_s if n_steps <= old_s else max(n_steps, 2 * old_s)
+        grown = np.full((new_m, new_s, 2), np.nan)
+        grown[:old_m, :old_s] = self.data
+        self.data = grown
+
+    def add(self, member_keys, step_keys, lon, lat):
+        members = self._index(member_keys, self.members)
+        steps = self._index(step_keys, self.steps)
+        self._reserve(len(self.members), len(self.steps))
+        self.data[members, steps, 0] = lon
+        self.data[members, steps, 1] = lat
+
+    def result(self):
+        data = self.data[:len(self.members), :len(self.steps)]
+        keys = list(self.steps)
+        try:
+            order = np.argsort([float(key) for key in keys], kind="stable")
+        except ValueError:
+            # e.g. ISO timestamps: text order is time order
+            order = np.argsort(keys, kind="stable")
+        return data[:, order]
+
+
+# --- PARSERS (one chunk of lines at a time) ---
+
+def _chunks(handle, chunk_lines):
+    while True:
+        lines = list(itertools.islice(handle, chunk_lines))
+        if not lines:
+            return
+        yield lines
+
+
+def _csv_columns(header, path):
+    names = [name.strip().lower() for name in header.split(",")]
+    columns = []
+    for field, aliases in CSV_COLUMNS.items():
+        found = [names.index(alias) for alias in aliases if alias in names]
+        if not found:
+            raise ValueError("{}: no {} column (accepted names: {})".format(path.name, field, ", ".join(aliases)))
+        columns.append(found[0])
+    return columns
+
+
+def _read_csv(path, buffer, chunk_lines):
+    with open(path, newline="") as handle:
+        columns = _csv_columns(handle.readline(), path)
+        for lines in _chunks(handle, chunk_lines):
+            fields = np.loadtxt(lines, delimiter=",", usecols=columns, dtype=str, ndmin=2)
+            fields = np.char.strip(fields)
+            buffer.add(fields[:, 0], fields[:, 1], fields[:, 3].astype(float), fields[:, 2].astype(float))
+
+
+def _atcf_degrees(values):
+    # "245N" -> 24.5, "860W" -> -86.0 (tenths of a degree + hemisphere)
+    values = np.char.strip(values)
+    hemisphere = np.array([value[-1:] for value in values.tolist()])
+    magnitude = np.array([value[:-1] for value in values.tolist()], dtype=float) / 10
+    return np.where(np.isin(hemisphere, ("S", "W")), -magnitude, magnitude)
+
+
+def _read_atcf(path, buffer, chunk_lines):
+    """ATCF a-deck style: BASIN, CY, YYYYMMDDHH, TECHNUM, TECH, TAU, LAT, LON, ..."""
+    with open(path) as handle:
+        for lines in _chunks(handle, chunk_lines):
+            rows = [line.split(",")[:8] for line in lines]
+            rows = [row for row in rows if len(row) == 8 and _ATCF_COORD.match(row[6]) and _ATCF_COORD.match(row[7])]
+            if not rows:
+                continue
+            fields = np.char.strip(np.array(rows))
+            # Member = forecast cycle + technique, step = forecast hour
+            members = np.char.add(np.char.add(fields[:, 2], "_"), fields[:, 4])
+            buffer.add(members, fields[:, 5], _atcf_degrees(fields[:, 7]), _atcf_degrees(fields[:, 6]))
+
+
+def _read_npz(path):
+    with np.load(path) as archive:
+        if "tracks" in archive:
+            return np.asarray(archive["tracks"], dtype=float)
+        return np.stack([archive["lon"], archive["lat"]], axis=-1).astype(float)
+
+
+# --- LOADING ---
+
+def _fill_gaps(tracks):
+    """Missing fixes take the nearest earlier fix (or the first one); empty members are dropped."""
+    valid = ~np.isnan(tracks[..., 0])
+    tracks = tracks[valid.any(axis=1)]
+    valid = valid[valid.any(axis=1)]
+    if valid.all():
+        return tracks
+
+    n_steps = tracks.shape[1]
+    steps = np.arange(n_steps)
+    last_valid = np.maximum.accumulate(np.where(valid, steps, -1), axis=1)
+    first_valid = valid.argmax(axis=1)[:, None]
+    source = np.where(last_valid < 0, first_valid, last_valid)
+    return np.take_along_axis(tracks, source[..., None], axis=1)
+
+
+def _cache_path(path):
+    return path.with_name("{}.tracks.npy".format(path.name))
+
+
+def load_ensemble_tracks(path, n_members=64, n_steps=256, chunk_lines=CHUNK_LINES):
+    """
+    Ensemble tracks as a (members, steps, 2) float64 array of (lon, lat) degrees.
+
+    .npz files hold either "tracks" (members, steps, 2) or "lon" and "lat"
+    (members, steps). .csv files need member, step, lat and lon columns (see
+    CSV_COLUMNS); anything else is read as ATCF a-deck text. Text is parsed
+    chunk_lines at a time into a buffer preallocated for n_members x n_steps,
+    and the result is cached as "<file>.tracks.npy" next to the source;
+    later loads memory-map that cache until the source changes.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".npz":
+        return _fill_gaps(_read_npz(path))
+
+    cache = _cache_path(path)
+    if not cache.is_file() or cache.stat().st_mtime < path.stat().st_mtime:
+        buffer = _TrackBuffer(n_members, n_steps)
+        reader = _read_csv if path.suffix.lower() == ".csv" else _read_atcf
+        reader(path, buffer, chunk_lines)
+        tracks = _fill_gaps(buffer.result())
+        tmp = cache.with_suffix(".tmp.npy")
+        np.save(tmp, tracks)
+        os.replace(tmp, cache)
+    return np.load(cache, mmap_mode="r")
+
+
+# --- PROJECTION ---
+
+def thin_steps(tracks, max_steps):
+    """Every k-th step (first and last always kept) so at most max_steps remain."""
+    n_steps = tracks.shape[1]
+    if n_steps <= max_steps:
+        return np.asarray(tracks)
+    keep = np.unique(np.linspace(0, n_steps - 1, max_steps).round().astype(np.int64))
+    return np.asarray(tracks[:, keep])
+
+
+def project_tracks(tracks, start, extent=(7.0, 4.0), heading=None):
+    """
+    (lon, lat) degrees -> scene (x, y), all members in one array expression.
+
+    Local equirectangular projection around the ensemble's mean first fix,
+    optionally rotated so the mean track points along `heading` (radians),
+    then scaled to fit `extent` and shifted so the first fix sits at `start`.
+    """
+    tracks = np.asarray(tracks, dtype=float)
+    origin = tracks[:, 0].mean(axis=0)
+    xy = tracks - origin
+    xy[..., 0] *= np.cos(np.radians(origin[1]))
+
+    if heading is not None:
+        mean_end = xy[:, -1].mean(axis=0)
+        angle = heading - np.arctan2(mean_end[1], mean_end[0])
+        rotation = np.array([[np.cos(angle), np.sin(angle)], [-np.sin(angle), np.cos(angle)]])
+        xy = xy @ rotation
+
+    size = np.ptp(xy.reshape(-1, 2), axis=0)
+    scale = min(extent[0] / max(size[0], 1e-9), extent[1] / max(size[1], 1e-9))
+    return np.asarray(start, dtype=float)[:2] + xy * scale
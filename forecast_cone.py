@@ -0,0 +1,101 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from statistics import NormalDist
+
+import numpy as np
+
+from binomial_dist import binomial_pmf_grid
+from multinomial_engine import branch_moments, multinomial_rows
+
+
+# --- PER-STEP QUANTILES ---
+# After t branchings, K = number of "lateral" branches ~ Binomial(t, p).
+# A confidence band at level L is the range [q((1-L)/2), q((1+L)/2)] of K, for every t.
+
+def _quantile_bands(cdf, levels, scale=1.0):
+    bands = {}
+    for level in levels:
+        lo_q, hi_q = (1 - level) / 2, (1 + level) / 2
+        # First k whose CDF reaches the target (cdf rows are non-decreasing)
+        k_lo = (cdf >= lo_q - 1e-12).argmax(axis=1)
+        k_hi = (cdf >= hi_q - 1e-12).argmax(axis=1)
+        bands[level] = (k_lo * scale, k_hi * scale)
+    return bands
+
+
+def binomial_bands(n_steps, levels=(0.5, 0.8, 0.95), p=0.5):
+    """{level: (k_lo, k_hi)} with integer quantile arrays of length n_steps + 1."""
+    return _quantile_bands(np.cumsum(binomial_pmf_grid(n_steps, p), axis=1), levels)
+
+
+def multinomial_bands(n_steps, levels=(0.5, 0.8, 0.95), weights=(1, 1, 1)):
+    """
+    Exact bands for K-way branching (e.g. left / straight / right). Lateral
+    position j of K - 1 possible moves per step is reported as k = j / (K - 1),
+    so the bands use the same geometry as the binary cone.
+    """
+    rows = multinomial_rows(n_steps, weights)
+    width = len(rows[-1])
+    cdf = np.ones((n_steps + 1, width))
+    for t, row in enumerate(rows):
+        cdf[t, :len(row)] = np.cumsum(row)
+    return _quantile_bands(cdf, levels, 1.0 / (len(weights) - 1))
+
+
+def normal_bands(n_steps, levels=(0.5, 0.8, 0.95), p=0.5, weights=None):
+    """Same as binomial_bands (or multinomial_bands, with weights) but with the normal approximation."""
+    t = np.arange(n_steps + 1, dtype=float)
+    mean, var = (p, p * (1 - p)) if weights is None else branch_moments(weights)
+    mean = t * mean
+    sd = np.sqrt(t * var)
+    bands = {}
+    for level in levels:
+        z = NormalDist().inv_cdf((1 + level) / 2)
+        bands[level] = (np.clip(mean - z * sd, 0, t), np.clip(mean + z * sd, 0, t))
+    return bands
+
+
+# --- GEOMETRY ---
+
+class ConeGeometry:
+    """
+    Maps (step t, lateral count k) to scene points:
+    origin + t * forward + k * lateral. Same layout as a Meru row per step.
+    """
+
+    def __init__(self, origin, forward, lateral):
+        self.origin = np.asarray(origin, dtype=float)
+        self.forward = np.asarray(forward, dtype=float)
+        self.lateral = np.asarray(lateral, dtype=float)
+
+    def points(self, t, k):
+        t = np.asarray(t, dtype=float)[:, None]
+        k = np.asarray(k, dtype=float)[:, None]
+        return self.origin + t * self.forward + k * self.lateral
+
+    def band_polygon(self, k_lo, k_hi):
+        """Vertices of one band: along k_lo forwards, back along k_hi."""
+        t = np.arange(len(k_lo))
+        return np.concatenate([self.points(t, k_lo), self.points(t[::-1], k_hi[::-1])])
+
+    def centerline(self, n_steps, p=0.5):
+        t = np.arange(n_steps + 1)
+        return self.points(t, t * p)
+
+
+def cone_polygons(geometry, n_steps, levels=(0.5, 0.8, 0.95), p=0.5, method="normal", weights=None):
+    """
+    {level: polygon vertices}, widest level first so it can be drawn underneath.
+    With weights, the cone is for K-way branching instead of up/down with probability p.
+    """
+    if method == "normal":
+        bands = normal_bands(n_steps, levels, p, weights)
+    elif weights is not None:
+        bands = multinomial_bands(n_steps, levels, weights)
+    else:
+        bands = binomial_bands(n_steps, levels, p)
+    return {level: geometry.band_polygon(*bands[level]) for level in sorted(levels, reverse=True)}
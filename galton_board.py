@@ -0,0 +1,154 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+from meru_engine import meru_row
+
+
+# --- SIMULATION (vectorized, independent of the animation) ---
+
+def galton_checkpoints(n_balls, n_rows, n_checkpoints=24, batch=1_000_000, seed=None, p=0.5):
+    """
+    Drop n_balls through n_rows of pegs and return (ball totals, bin counts) at
+    n_checkpoints geometrically spaced totals. Each batch is one binomial draw
+    plus one np.bincount, so millions of balls take well under a second.
+    """
+    rng = np.random.default_rng(seed)
+    totals = np.unique(np.geomspace(1, n_balls, n_checkpoints).astype(np.int64))
+    snapshots = np.empty((len(totals), n_rows + 1), dtype=np.int64)
+
+    counts = np.zeros(n_rows + 1, dtype=np.int64)
+    dropped = 0
+    for i, target in enumerate(totals):
+        while dropped < target:
+            size = int(min(batch, target - dropped))
+            counts += np.bincount(rng.binomial(n_rows, p, size), minlength=n_rows + 1)
+            dropped += size
+        snapshots[i] = counts
+    return totals, snapshots
+
+
+def sample_trajectories(n_paths, n_rows, seed=None):
+    """(n_paths, n_rows + 1) number of right-bounces after each row, starting at 0."""
+    rng = np.random.default_rng(seed)
+    bounces = rng.integers(0, 2, size=(n_paths, n_rows))
+    return np.concatenate([np.zeros((n_paths, 1), dtype=np.int64), np.cumsum(bounces, axis=1)], axis=1)
+
+
+class GaltonBoardMeru(Scene):
+    # Size knobs: peg rows, simulated balls, animated sample balls
+    n_rows = 12
+    n_balls = 2_000_000
+    n_sample_paths = 6
+
+    def construct(self):
+        # --- CINEMATIC CONFIGURATION ---
+        self.camera.background_color = "#00020A"
+        PEG_COLOR = "#C5B358"
+        BALL_COLOR = "#00FFFF"
+        BAR_COLOR = "#00FFAA"
+        MERU_GOLD = "#FFD700"
+
+        n_rows = self.n_rows
+
+        title = Text("Galton Board: Meru Prastara in Motion", font_size=28, color=MERU_GOLD).to_edge(UP, buff=0.3)
+        self.play(Write(title))
+
+        # --- PEGS (row r has r + 1 pegs, like Meru row r) ---
+        top = np.array([0, 2.6, 0])
+        dx = 6.0 / (n_rows + 1)
+        dy = 3.6 / n_rows
+
+        def peg_position(row, rights):
+            return top + np.array([(2 * rights - row) * dx / 2, -row * dy, 0])
+
+        pegs = VGroup(*[
+            Dot(peg_position(row, k), radius=min(0.05, 0.6 / n_rows), color=PEG_COLOR)
+            for row in range(n_rows) for k in range(row + 1)
+        ])
+        self.play(FadeIn(pegs, lag_ratio=0.01), run_time=1.5)
+
+        # --- BINS + PASCAL TARGET ---
+        # Bars grow upwards from the floor under the last peg row
+        floor_y = top[1] - n_rows * dy - 2.4
+        bin_width = dx * 0.8
+        max_bar = 2.2
+
+        pascal = np.array(meru_row(n_rows), dtype=float)
+        expected = pascal / pascal.sum()
+        scale = max_bar / expected.max()
+        bin_x = [peg_position(n_rows, k)[0] for k in range(n_rows + 1)]
+
+        targets = VGroup(*[
+            Line([x - bin_width / 2, floor_y + h * scale, 0], [x + bin_width / 2, floor_y + h * scale, 0],
+                 color=MERU_GOLD, stroke_width=3)
+            for x, h in zip(bin_x, expected)
+        ])
+        target_label = Text("Pascal row {} / 2^{}".format(n_rows, n_rows), font_size=16, color=MERU_GOLD)
+        target_label.next_to(targets, RIGHT, buff=0.3)
+
+        # --- SIMULATE ONCE, ANIMATE ONLY THE AGGREGATES ---
+        totals, snapshots = galton_checkpoints(self.n_balls, n_rows, seed=7)
+        freqs = snapshots / totals[:, None]
+        progress = ValueTracker(0)
+
+        def current_freqs():
+            x = progress.get_value()
+            i = min(int(x), len(freqs) - 2)
+            alpha = min(x - i, 1.0)
+            return (1 - alpha) * freqs[i] + alpha * freqs[i + 1]
+
+        def current_total():
+            x = progress.get_value()
+            i = min(int(x), len(totals) - 2)
+            return int(totals[i] + min(x - i, 1.0) * (totals[i + 1] - totals[i]))
+
+        bars = VGroup(*[
+            Rectangle(width=bin_width, height=0.01, stroke_width=0, fill_color=BAR_COLOR, fill_opacity=0.75)
+            for _ in bin_x
+        ])
+
+        def update_bars(group):
+            for bar, x, f in zip(group, bin_x, current_freqs()):
+                bar.stretch_to_fit_height(max(f * scale, 0.01))
+                bar.move_to([x, floor_y, 0], aligned_edge=DOWN)
+
+        update_bars(bars)
+        bars.add_updater(update_bars)
+
+        ball_counter = Integer(1, font_size=30, color=BALL_COLOR)
+        ball_counter.add_updater(lambda m: m.set_value(current_total()))
+        counter_label = Text("Balls dropped", font_size=18, color=GRAY_B)
+        counter_group = VGroup(counter_label, ball_counter).arrange(DOWN, buff=0.15).to_corner(UL, buff=0.6).shift(DOWN * 0.6)
+
+        self.play(FadeIn(bars), Create(targets), FadeIn(target_label), FadeIn(counter_group))
+
+        # --- A FEW SAMPLE BALLS (the rest are only counted) ---
+        paths = sample_trajectories(self.n_sample_paths, n_rows, seed=3)
+        balls = VGroup()
+        moves = []
+        for path in paths:
+            points = [top + UP * dy] + [peg_position(row, k) + UP * 0.12 for row, k in enumerate(path[:-1])]
+            points.append(np.array([bin_x[path[-1]], floor_y + 0.1, 0]))
+            track = VMobject().set_points_as_corners(points)
+            ball = Dot(points[0], radius=0.07, color=BALL_COLOR)
+            balls.add(ball)
+            moves.append(MoveAlongPath(ball, track, rate_func=linear))
+
+        self.play(LaggedStart(*moves, lag_ratio=0.25), run_time=4)
+        self.play(FadeOut(balls))
+
+        # --- MILLIONS OF BALLS: frame cost depends only on the number of bins ---
+        self.play(progress.animate.set_value(len(totals) - 1), run_time=6, rate_func=smooth)
+
+        bars.clear_updaters()
+        ball_counter.clear_updaters()
+        conclusion = Text("Random bounces -> Pascal's Triangle -> Bell Curve", font_size=20, color=WHITE)
+        conclusion.to_edge(DOWN, buff=0.3)
+        self.play(Write(conclusion), Indicate(targets, color=MERU_GOLD))
+
+        self.wait(3)
@@ -0,0 +1,92 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from collections import OrderedDict
+
+from manim import MathTex, Tex, Text
+
+from glyph_store import install_glyph_store
+
+# Templates missing here are still read from the on-disk SVG store when another
+# process (or an earlier render) has already compiled them
+install_glyph_store()
+
+
+class GlyphCache:
+    """
+    In-process template cache for Text / MathTex / Tex mobjects.
+
+    The first request for (string, class, font, font_size) pays for the
+    LaTeX/Pango -> SVG round trip; every later request is a cheap .copy()
+    of the stored template. Color is applied to the copy, so "1" in gold
+    and "1" in cyan share one template.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._templates = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._templates)
+
+    def get(self, cls, text, font=None, font_size=None, color=None, **style):
+        key = (text, cls.__name__, font, font_size, tuple(sorted(style.items())))
+        template = self._templates.get(key)
+
+        if template is None:
+            self.misses += 1
+            kwargs = dict(style)
+            if font is not None:
+                kwargs["font"] = font
+            if font_size is not None:
+                kwargs["font_size"] = font_size
+            template = cls(text, **kwargs)
+            self._templates[key] = template
+            if len(self._templates) > self.maxsize:
+                self._templates.popitem(last=False)
+        else:
+            self.hits += 1
+            self._templates.move_to_end(key)
+
+        mob = template.copy()
+        if color is not None:
+            mob.set_color(color)
+        return mob
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._templates),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._templates.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_default_cache = GlyphCache()
+
+
+def glyph_cache():
+    return _default_cache
+
+
+def cached_text(text, **kwargs):
+    return _default_cache.get(Text, text, **kwargs)
+
+
+def cached_math_tex(tex, **kwargs):
+    return _default_cache.get(MathTex, tex, **kwargs)
+
+
+def cached_tex(tex, **kwargs):
+    return _default_cache.get(Tex, tex, **kwargs)
@@ -0,0 +1,210 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Persistent glyph SVG store shared by every render process.
+
+GlyphCache (glyph_cache.py) only lives as long as one process; this store
+keeps the SVG files LaTeX and Pango produce on disk, so a fresh worker that
+asks for "2^n" again reads the SVG instead of running latex + dvisvgm.
+
+    install_glyph_store()     # route manim's Tex / Text SVG creation through the store
+    glyph_store().stats()     # hits, misses, hit_rate, evictions, bytes
+
+Entries are keyed by a hash of the content and everything that changes the
+glyphs (TeX template / environment, or Pango font, weight, slant, size,
+colour...). Writes go to a temporary file and are renamed into place, so
+concurrent workers never see half-written SVGs. When the directory grows
+past max_bytes, the least recently used files are removed.
+"""
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+STORE_ENV = "MATHRIZE_GLYPH_STORE"
+DEFAULT_STORE_DIR = Path(__file__).resolve().parent / "media" / "glyph_store"
+DEFAULT_MAX_BYTES = 256 * 2 ** 20
+# Files used this recently are never evicted (another worker may be reading them)
+EVICT_MIN_AGE = 60.0
+
+
+def _digest(*parts):
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(str(part).encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:32]
+
+
+class GlyphStore:
+    def __init__(self, directory=DEFAULT_STORE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self._bytes = None
+
+    def path(self, key):
+        return self.directory / "{}.svg".format(key)
+
+    def lookup(self, key):
+        """Stored SVG path for key (and mark it recently used), or None."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key, source):
+        """Copy an SVG into the store atomically; returns the stored path."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        handle, tmp = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(handle, "wb") as out, open(source, "rb") as src:
+                shutil.copyfileobj(src, out)
+            os.replace(tmp, self.path(key))
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self.writes += 1
+
+        size = self.path(key).stat().st_size
+        if self._bytes is None:
+            self._bytes = self.total_bytes()
+        else:
+            self._bytes += size
+        if self._bytes > self.max_bytes:
+            self.evict()
+        return self.path(key)
+
+    def _entries(self):
+        entries = []
+        for path in self.directory.glob("*.svg"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def total_bytes(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target=None):
+        """Remove least recently used files until the store is under target bytes (90% of max)."""
+        target = int(self.max_bytes * 0.9) if target is None else target
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        cutoff = time.time() - EVICT_MIN_AGE
+        for mtime, size, path in entries:
+            if total <= target or mtime > cutoff:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                # Another worker evicted it first
+                pass
+            total -= size
+            self.evictions += 1
+        self._bytes = total
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "bytes": self._bytes if self._bytes is not None else self.total_bytes(),
+        }
+
+    def reset_stats(self):
+        """Zero the counters, e.g. at the start of each job in a reused worker process."""
+        self.hits = self.misses = self.writes = self.evictions = 0
+
+    def clear(self):
+        for _, _, path in self._entries():
+            path.unlink()
+        self._bytes = 0
+
+
+_default_store = None
+
+
+def _disabled():
+    return os.environ.get(STORE_ENV) == "0"
+
+
+def glyph_store():
+    """The process-wide store, or None when MATHRIZE_GLYPH_STORE=0 and none was installed."""
+    global _default_store
+    if _default_store is None:
+        if _disabled():
+            return None
+        _default_store = GlyphStore(os.environ.get(STORE_ENV) or DEFAULT_STORE_DIR)
+    return _default_store
+
+
+# --- MANIM HOOKS ---
+
+_installed = False
+
+
+def install_glyph_store(store=None):
+    """
+    Wrap manim's Tex -> SVG and Text -> SVG steps with the store (idempotent).
+    MATHRIZE_GLYPH_STORE=0 disables it; any other value is the store directory.
+    A store passed in replaces the default one, even after installation.
+    """
+    global _installed, _default_store
+    if store is not None:
+        _default_store = store
+    if _installed or _disabled():
+        return
+
+    import manim
+    from manim.mobject.text import tex_mobject, text_mobject
+
+    tex_to_svg_file = tex_mobject.tex_to_svg_file
+
+    def stored_tex_to_svg_file(expression, environment=None, tex_template=None):
+        template = tex_template or manim.config.tex_template
+        key = _digest("tex", manim.__version__, expression, environment,
+                      template.body, template.tex_compiler, template.output_format)
+        path = glyph_store().lookup(key)
+        if path is None:
+            path = glyph_store().put(key, tex_to_svg_file(expression, environment=environment, tex_template=tex_template))
+        return Path(path)
+
+    tex_mobject.tex_to_svg_file = stored_tex_to_svg_file
+
+    def wrap_text(cls):
+        text2svg = cls.__dict__.get("_text2svg")
+        if text2svg is None or not hasattr(cls, "_text2hash"):
+            return
+
+        def stored_text2svg(self, *args, **kwargs):
+            # _text2hash covers the text, font, slant, weight, size, spacing and colour
+            key = _digest("text", cls.__name__, manim.__version__, self._text2hash(*args, **kwargs))
+            path = glyph_store().lookup(key)
+            if path is None:
+                path = glyph_store().put(key, text2svg(self, *args, **kwargs))
+            return str(path)
+
+        cls._text2svg = stored_text2svg
+
+    wrap_text(text_mobject.Text)
+    wrap_text(text_mobject.MarkupText)
+    _installed = True
@@ -0,0 +1,66 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Fast launcher: finds a scene by name from the cached static index
+(scene_modules.scene_index) and imports manim plus that one scene file only.
+
+    python launch.py --list                  # all scenes, no manim import
+    python launch.py GaltonBoardMeru -q l    # render one scene
+    python launch.py sierpinski -p           # case-insensitive part of the name, then preview
+    python launch.py WeatherMeruCone --draft # seconds-long preview (see draft_mode.py)
+"""
+import argparse
+import os
+import sys
+import time
+
+from scene_modules import ROOT, scene_index
+
+
+def find_scene(query, scenes):
+    """(path, class name) for an exact class name, else a unique case-insensitive substring."""
+    exact = [scene for scene in scenes if scene[1] == query]
+    if exact:
+        return exact[0]
+    matches = [scene for scene in scenes if query.lower() in scene[1].lower()]
+    if len(matches) == 1:
+        return matches[0]
+    if not matches:
+        raise SystemExit("no scene matches {!r} (try --list)".format(query))
+    raise SystemExit("{!r} is ambiguous: {}".format(query, ", ".join(name for _, name in matches)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one MathRize scene without importing the others.")
+    parser.add_argument("scene", nargs="?", help="scene class name, or a unique part of it")
+    parser.add_argument("-q", "--quality", choices=["l", "m", "h", "p", "k"], default="h")
+    parser.add_argument("-p", "--preview", action="store_true", help="open the movie when done")
+    parser.add_argument("--media-dir", default=None, help="output directory (default: ./media)")
+    parser.add_argument("--draft", action="store_true", help="low-res preview with capped sizes (also MATHRIZE_DRAFT=1)")
+    parser.add_argument("--list", action="store_true", help="list scenes and exit")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    scenes = scene_index()
+    if args.list or not args.scene:
+        for path, name in scenes:
+            print("{:32s} {}".format(name, path.name))
+        print("{} scenes indexed in {:.0f} ms".format(len(scenes), 1000 * (time.perf_counter() - t0)))
+        return 0
+
+    path, name = find_scene(args.scene, scenes)
+    print("{} ({}) found in {:.0f} ms".format(name, path.name, 1000 * (time.perf_counter() - t0)))
+
+    # Only now pay for manim and the one scene module
+    from batch_render import render_scene
+    draft = args.draft or os.environ.get("MATHRIZE_DRAFT", "") not in ("", "0")
+    output = render_scene(path, name, args.quality, args.media_dir or ROOT / "media", args.preview, draft)
+    print("rendered", output, "({:.1f}s)".format(time.perf_counter() - t0))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from pingala_patterns import GURU, LAGHU
+
+# Matra-vrtta: meters counted by beats (morae). Laghu "|" = 1 beat, guru "S" = 2 beats.
+# Patterns of n beats: "|" + (patterns of n - 1) then "S" + (patterns of n - 2),
+# so there are F(n + 1) of them (Fibonacci, the Matra-Meru).
+
+
+# --- COUNTING (fast doubling, O(log n) big-int steps) ---
+
+def _fib_pair(k):
+    # (F(k), F(k + 1)) using F(2m) = F(m)(2F(m+1) - F(m)), F(2m+1) = F(m)^2 + F(m+1)^2
+    if k == 0:
+        return 0, 1
+    a, b = _fib_pair(k >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    return (d, c + d) if k & 1 else (c, d)
+
+
+def fibonacci(k):
+    if k < 0:
+        raise ValueError("k must be non-negative")
+    return _fib_pair(k)[0]
+
+
+def matra_count(n):
+    """Number of meters with exactly n beats."""
+    return fibonacci(n + 1) if n >= 0 else 0
+
+
+# --- ENUMERATION (same "|" before "S" order as the Pingala prastara) ---
+
+def _count_table(n):
+    # counts[m] = matra_count(m) for m = 0 .. n, built once in O(n)
+    counts = [1, 1]
+    for _ in range(2, n + 1):
+        counts.append(counts[-1] + counts[-2])
+    return counts[:n + 1] if n >= 0 else []
+
+
+def _unrank_parts(index, n, counts):
+    parts = []
+    while n > 0:
+        first_laghu = counts[n - 1]
+        if index < first_laghu:
+            parts.append(1)
+            n -= 1
+        else:
+            index -= first_laghu
+            parts.append(2)
+            n -= 2
+    return parts
+
+
+def _to_symbols(parts):
+    return "".join(LAGHU if part == 1 else GURU for part in parts)
+
+
+def matra_pattern(index, n):
+    """Meter number `index` (0-based) among all meters of n beats."""
+    total = matra_count(n)
+    if not 0 <= index < total:
+        raise IndexError(f"pattern index {index} out of range for {n} beats")
+    return _to_symbols(_unrank_parts(index, n, _count_table(n)))
+
+
+def iter_matra_patterns(n, start=0, stop=None):
+    """
+    Lazily yield meters start .. stop - 1 of n beats. Only the current
+    pattern is kept; each next one is the lexicographic successor
+    (rightmost "|" that has beats after it becomes "S", the rest become "|").
+    """
+    total = matra_count(n)
+    stop = total if stop is None else min(stop, total)
+    start = max(start, 0)
+    if start >= stop:
+        return
+
+    parts = _unrank_parts(start, n, _count_table(n))
+    yield _to_symbols(parts)
+    for _ in range(start + 1, stop):
+        suffix = 0
+        i = len(parts) - 1
+        while not (parts[i] == 1 and suffix >= 1):
+            suffix += parts[i]
+            i -= 1
+        # "|" at i becomes "S" (borrowing one beat), remaining beats are all "|"
+        del parts[i:]
+        parts.append(2)
+        parts.extend([1] * (suffix - 1))
+        yield _to_symbols(parts)
+
+
+class MatraMeru:
+    """
+    Unranking for one beat count, with the count table built once (O(n) per lookup).
+    The number of meters is `total`, a plain int: there is no __len__, since
+    len() cannot return F(n + 1) once n >= 92.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.counts = _count_table(n)
+        self.total = self.counts[n] if n >= 0 else 0
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.total:
+            raise IndexError(index)
+        return _to_symbols(_unrank_parts(index, self.n, self.counts))
@@ -0,0 +1,142 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+# Rows handled per block in the NumPy parity / mod-p builders (bounds memory)
+ROW_BLOCK = 512
+
+
+# --- EXACT ROWS (Python big ints) ---
+
+def meru_row(n):
+    """Row n of the Meru Prastara in O(n) with C(n, k+1) = C(n, k) * (n - k) / (k + 1)."""
+    if n < 0:
+        raise ValueError("row index must be non-negative")
+    row = [1]
+    for k in range(n):
+        row.append(row[-1] * (n - k) // (k + 1))
+    return tuple(row)
+
+
+class MeruRowCache:
+    """
+    Memoized Meru rows with least-recently-used eviction.
+    A missing row is built from row n - 1 when that one is cached
+    (Meru addition rule), otherwise directly with meru_row(n).
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._rows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, n):
+        return n in self._rows
+
+    def get(self, n):
+        if n in self._rows:
+            self.hits += 1
+            self._rows.move_to_end(n)
+            return self._rows[n]
+
+        self.misses += 1
+        prev_row = self._rows.get(n - 1)
+        if prev_row is not None:
+            row = (1,) + tuple(prev_row[j] + prev_row[j + 1] for j in range(len(prev_row) - 1)) + (1,)
+        else:
+            row = meru_row(n)
+
+        self._rows[n] = row
+        if len(self._rows) > self.maxsize:
+            self._rows.popitem(last=False)
+        return row
+
+    def rows(self, n_rows):
+        return [self.get(i) for i in range(n_rows)]
+
+    def clear(self):
+        self._rows.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_default_cache = MeruRowCache()
+
+
+def meru_rows(n_rows):
+    """First n_rows rows of the triangle (rows 0 .. n_rows - 1), shared cache."""
+    return _default_cache.rows(n_rows)
+
+
+def row_cache():
+    return _default_cache
+
+
+# --- PARITY / MOD-P ROWS (NumPy, no Python int per cell) ---
+
+def parity_rows_packed(n_rows):
+    """
+    Odd/even pattern of the first n_rows rows, bit-packed along each row:
+    shape (n_rows, ceil(n_rows / 8)), uint8, same layout as np.packbits.
+    Lucas' theorem for p = 2: C(n, k) is odd exactly when k & n == k,
+    which is the rule-90 (Sierpinski) automaton.
+    """
+    k = np.arange(n_rows)
+    packed = np.zeros((n_rows, (n_rows + 7) // 8), dtype=np.uint8)
+    for r0 in range(0, n_rows, ROW_BLOCK):
+        n = np.arange(r0, min(r0 + ROW_BLOCK, n_rows))[:, None]
+        packed[r0:r0 + len(n)] = np.packbits((n & k) == k, axis=1)
+    return packed
+
+
+def parity_rows(n_rows):
+    """Boolean (n_rows, n_rows) array, True where C(n, k) is odd (k <= n)."""
+    return np.unpackbits(parity_rows_packed(n_rows), axis=1, count=n_rows).astype(bool)
+
+
+def _small_binomials_mod(p):
+    table = np.zeros((p, p), dtype=np.int64)
+    table[:, 0] = 1
+    for a in range(1, p):
+        table[a, 1:] = (table[a - 1, 1:] + table[a - 1, :-1]) % p
+    return table
+
+
+def mod_p_rows(n_rows, p):
+    """
+    C(n, k) mod p for the first n_rows rows as an (n_rows, n_rows) array.
+    Uses Lucas' theorem digit by digit in base p, so p must be prime.
+    Cells with k > n are 0.
+    """
+    if p < 2 or any(p % d == 0 for d in range(2, int(p ** 0.5) + 1)):
+        raise ValueError("p must be a prime number")
+    if p == 2:
+        return parity_rows(n_rows).astype(np.uint8)
+
+    table = _small_binomials_mod(p)
+    dtype = np.uint8 if p < 256 else np.uint32
+    out = np.zeros((n_rows, n_rows), dtype=dtype)
+    k_all = np.arange(n_rows)
+    for r0 in range(0, n_rows, ROW_BLOCK):
+        n = np.arange(r0, min(r0 + ROW_BLOCK, n_rows))[:, None].copy()
+        k = np.broadcast_to(k_all, (len(n), n_rows)).copy()
+        n = np.broadcast_to(n, k.shape).copy()
+        block = np.ones(k.shape, dtype=np.int64)
+        while n.any():
+            block = block * table[n % p, k % p] % p
+            n //= p
+            k //= p
+        # Leftover digits of k mean k > n, so C(n, k) = 0
+        block[k > 0] = 0
+        out[r0:r0 + len(block)] = block
+    return out
@@ -5,8 +5,17 @@ License: MIT License (See LICENSE file for details)
 YouTube: https://www.youtube.com/@MathRize
 """
 from manim import *
+from glyph_cache import cached_tex
+from meru_engine import meru_rows, parity_rows
+from meru_raster import magnitude_image, parity_image
 
 class MeruEpicReveal(Scene):
+    # Size knob: number of triangle rows
+    n_rows = 8
+    # "glyphs" (one Tex per number), "raster" (one image) or "auto"
+    render_mode = "auto"
+    RASTER_THRESHOLD = 32
+
     def construct(self):
         # --- CINEMATIC CONFIGURATION ---
         # Ultra Deep Space Background
@@ -18,17 +27,15 @@ class MeruEpicReveal(Scene):
         NEON_CYAN = "#00FFFF"     
         FADED_BLUE = "#001F3F"    
 
-        # --- BUILD ROWS (8 Rows) ---
-        rows = []
-        n_rows = 8 
-        rows.append([1])
-        for i in range(1, n_rows):
-            prev_row = rows[-1]
-            new_row = [1] 
-            for j in range(len(prev_row) - 1):
-                new_row.append(prev_row[j] + prev_row[j+1])
-            new_row.append(1) 
-            rows.append(new_row)
+        # --- BIG TRIANGLES: RASTER MODE ---
+        if self.render_mode == "raster" or (self.render_mode == "auto" and self.n_rows > self.RASTER_THRESHOLD):
+            self.construct_raster(ANCIENT_GOLD, NEON_CYAN, FADED_BLUE)
+            return
+
+        # --- BUILD ROWS (n_rows, default 8) ---
+        rows = meru_rows(self.n_rows)
+        # Odd/even pattern straight from Lucas' theorem (no big ints needed)
+        odd_mask = parity_rows(self.n_rows)
 
         # --- VISUALIZATION SETUP ---
         visual_rows = VGroup()
@@ -38,10 +45,10 @@ class MeruEpicReveal(Scene):
 
         for i, row_nums in enumerate(rows):
             row_mob = VGroup()
-            for num in row_nums:
-                is_odd = num % 2 != 0
-                # Using Tex for Cinematic Look
-                t = Tex(str(num), font_size=NUMBER_FONT_SIZE, color=ANCIENT_GOLD)
+            for j, num in enumerate(row_nums):
+                is_odd = bool(odd_mask[i, j])
+                # Using Tex for Cinematic Look (cached: repeated numbers are copies)
+                t = cached_tex(str(num), font_size=NUMBER_FONT_SIZE, color=ANCIENT_GOLD)
                 t.is_odd = is_odd 
                 row_mob.add(t)
                 
@@ -96,3 +103,42 @@ class MeruEpicReveal(Scene):
 
 
         self.wait(4)
+
+    def construct_raster(self, ANCIENT_GOLD, NEON_CYAN, FADED_BLUE):
+        # Same three phases as the glyph version, but the whole triangle is two
+        # precomputed images, so frame cost does not depend on n_rows.
+        # Gold layer: brightness = size of C(n, k) within its row
+        ancient_layer = ImageMobject(magnitude_image(self.n_rows, ANCIENT_GOLD))
+        # Neon layer: odd cells light up, even cells fade (Sierpinski)
+        reveal_layer = ImageMobject(parity_image(self.n_rows, NEON_CYAN, FADED_BLUE, even_alpha=0.1))
+
+        for layer in (ancient_layer, reveal_layer):
+            layer.set_resampling_algorithm(RESAMPLING_ALGORITHMS["box"])
+            layer.height = config.frame_height * 0.85
+            layer.move_to(ORIGIN)
+
+        # --- ANIMATION PHASE 1: ANCIENT STRUCTURE ---
+        self.wait(0.5)
+        self.play(FadeIn(ancient_layer, shift=UP*0.3, scale=1.1), run_time=2.5)
+        self.wait(1)
+
+        # --- ANIMATION PHASE 2: EPIC REVEAL (colormap cross-fade) ---
+        self.play(
+            FadeIn(reveal_layer),
+            FadeOut(ancient_layer),
+            run_time=3,
+            rate_func=rate_functions.ease_in_out_expo
+        )
+
+        self.play(
+            reveal_layer.animate.scale(1.2), # Zoom in effect
+            run_time=2
+        )
+
+        self.wait(4)
+
+
+class MeruSierpinskiReveal(MeruEpicReveal):
+    # Full Sierpinski pattern: far too many rows for one Tex per number
+    n_rows = 512
+    render_mode = "raster"
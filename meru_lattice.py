@@ -0,0 +1,78 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+from meru_engine import meru_rows
+
+
+class BinomialLattice:
+    """
+    Recombining binomial tree (Meru lattice).
+
+    Node (step, ups) is stored exactly once, so a tree with N steps has
+    (N+1)(N+2)/2 nodes and N(N+1) edges instead of 2^N branches.
+    Path counts follow the Meru rule: count(s, u) = count(s-1, u-1) + count(s-1, u).
+    """
+
+    def __init__(self, steps):
+        if steps < 0:
+            raise ValueError("steps must be non-negative")
+        self.steps = steps
+
+        # --- PATH COUNTS (one Meru row per step) ---
+        self.counts = meru_rows(steps + 1)
+
+    def __len__(self):
+        return (self.steps + 1) * (self.steps + 2) // 2
+
+    def nodes(self):
+        # (step, ups) in row order, bottom (all downs) to top (all ups)
+        for step in range(self.steps + 1):
+            for ups in range(step + 1):
+                yield step, ups
+
+    def edges(self):
+        # Every non-terminal node has a down-child and an up-child
+        for step in range(self.steps):
+            for ups in range(step + 1):
+                yield (step, ups), (step + 1, ups)
+                yield (step, ups), (step + 1, ups + 1)
+
+    def path_count(self, step, ups):
+        return self.counts[step][ups]
+
+    def terminal_counts(self):
+        return list(self.counts[-1])
+
+    def node_position(self, origin, step, ups, dx, dy):
+        origin = np.asarray(origin, dtype=float)
+        return origin + np.array([step * dx, (2 * ups - step) * dy, 0.0])
+
+    def node_positions(self, origin, dx, dy):
+        # Vectorized positions of every node, same order as nodes()
+        steps, ups = self.index_arrays()
+        offsets = np.stack([steps * dx, (2 * ups - steps) * dy, np.zeros(len(steps))], axis=1)
+        return np.asarray(origin, dtype=float) + offsets
+
+    def index_arrays(self):
+        steps = np.repeat(np.arange(self.steps + 1), np.arange(1, self.steps + 2))
+        ups = np.concatenate([np.arange(step + 1) for step in range(self.steps + 1)])
+        return steps, ups
+
+    def edge_segments(self, origin, dx, dy):
+        # (E, 2, 3) array of edge start/end points, same order as edges()
+        parents = self.node_positions(origin, dx, dy)[: self.steps * (self.steps + 1) // 2]
+        segments = np.empty((len(parents), 2, 2, 3))
+        segments[:, :, 0] = parents[:, None, :]
+        segments[:, :, 1] = parents[:, None, :]
+        segments[:, 0, 1] += [dx, -dy, 0.0]
+        segments[:, 1, 1] += [dx, dy, 0.0]
+        return segments.reshape(-1, 2, 3)
+
+    def edge_steps(self):
+        # Step of each edge's parent, same order as edges()
+        return np.repeat(np.arange(self.steps), 2 * np.arange(1, self.steps + 1))
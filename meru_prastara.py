@@ -5,8 +5,14 @@ License: MIT License (See LICENSE file for details)
 YouTube: https://www.youtube.com/@MathRize
 """
 from manim import *
+from edge_set import EdgeSet
+from glyph_cache import cached_math_tex
+from meru_engine import meru_rows
 
 class MeruPrastaraCompact(Scene):
+    # Size knob: number of triangle rows
+    n_rows = 5
+
     def construct(self):
         # --- CONFIGURATION ---
         GOLD_TEXT = "#FFD700"  
@@ -25,55 +31,81 @@ class MeruPrastaraCompact(Scene):
         self.wait(1)
 
         # --- HELPER: BUILD ROWS ---
-        rows = []
-        n_rows = 5 
-        rows.append([1])
-        for i in range(1, n_rows):
-            prev_row = rows[-1]
-            new_row = [1] 
-            for j in range(len(prev_row) - 1):
-                new_row.append(prev_row[j] + prev_row[j+1])
-            new_row.append(1) 
-            rows.append(new_row)
+        rows = meru_rows(self.n_rows)
 
         # --- VISUALIZATION SETUP ---
-        visual_rows = VGroup()
         # COMPACT SETTINGS: Chhota Gap aur Chhota Font
         VERTICAL_GAP = 0.8
         HORIZONTAL_GAP = 1.2
         NUMBER_FONT_SIZE = 36
+        # Seconds per row (a fade-in of the row, then its lines)
+        ROW_TIME = 1.3
 
-        for i, row_nums in enumerate(rows):
-            row_mob = VGroup(*[MathTex(str(num), color=GOLD_TEXT, font_size=NUMBER_FONT_SIZE) for num in row_nums])
-            row_mob.arrange(RIGHT, buff=HORIZONTAL_GAP)
-            visual_rows.add(row_mob)
+        # Layout is computed up front from the widest number, so rows can be
+        # built only when the animation reaches them
+        widest = cached_math_tex(str(max(rows[-1])), font_size=NUMBER_FONT_SIZE)
+        cell_height = widest.height
+        pitch_x = widest.width + HORIZONTAL_GAP
+        pitch_y = cell_height + VERTICAL_GAP
 
-        visual_rows.arrange(DOWN, buff=VERTICAL_GAP)
-        
         # --- POSITIONING FIX ---
         # Diagram ko title ke thoda paas rakha taaki neeche jagah bache (Buffer 0.8)
-        visual_rows.next_to(title_group, DOWN, buff=0.8)
+        top_y = title_group.get_bottom()[1] - 0.8 - cell_height / 2
+
+        def cell_center(i, j):
+            return np.array([(j - i / 2) * pitch_x, top_y - i * pitch_y, 0])
+
+        def build_row(i):
+            return VGroup(*[
+                cached_math_tex(str(num), color=GOLD_TEXT, font_size=NUMBER_FONT_SIZE).move_to(cell_center(i, j))
+                for j, num in enumerate(rows[i])
+            ])
+
+        def build_row_lines(i):
+            # Parent j of row i connects to children j and j+1; the whole row is one EdgeSet
+            half = UP * cell_height / 2
+            segments = np.array([
+                (cell_center(i, j) - half, cell_center(i + 1, j + k) + half)
+                for j in range(i + 1) for k in (0, 1)
+            ])
+            return EdgeSet(segments, color=CONNECT_COLOR, opacity=0.5, stroke_width=2)
+
+        visual_rows = VGroup(build_row(0))
+        lines_group = VGroup()
 
         # --- ANIMATION SEQUENCE ---
         self.play(GrowFromCenter(visual_rows[0]), run_time=1)
         self.wait(0.5)
 
-        lines_group = VGroup()
-        for i in range(len(visual_rows) - 1):
-            current_row = visual_rows[i]
-            next_row = visual_rows[i+1]
-            self.play(FadeIn(next_row, shift=DOWN), run_time=0.8)
-            
-            row_lines = VGroup()
-            for j in range(len(current_row)):
-                parent = current_row[j]
-                child_left = next_row[j]
-                child_right = next_row[j+1]
-                line1 = Line(parent.get_bottom(), child_left.get_top(), color=CONNECT_COLOR, stroke_width=2, stroke_opacity=0.5)
-                line2 = Line(parent.get_bottom(), child_right.get_top(), color=CONNECT_COLOR, stroke_width=2, stroke_opacity=0.5)
-                row_lines.add(line1, line2)
-            self.play(Create(row_lines), run_time=0.5)
-            lines_group.add(row_lines)
+        # One play for the whole triangle: growth = 2.4 means rows 0..2 are done
+        # and row 3 is 40% in. Row i fades in (dropping into place) during the
+        # first 60% of its unit, then its lines grow from row i - 1.
+        growth = ValueTracker(0)
+        settled = [1]
+
+        def grow(triangle):
+            value = growth.get_value()
+            # Materialize rows and lines only when the tracker reaches them
+            while len(visual_rows) < min(int(value) + 2, len(rows)):
+                i = len(visual_rows)
+                visual_rows.add(build_row(i).set_opacity(0))
+                lines_group.add(build_row_lines(i - 1).set_progress(0))
+            for i in range(settled[0], len(visual_rows)):
+                alpha = min(max(value - (i - 1), 0.0), 1.0)
+                fade = min(alpha / 0.6, 1.0)
+                row_mob = visual_rows[i]
+                row_mob.set_opacity(fade)
+                row_mob.move_to([0, top_y - i * pitch_y + 0.3 * (1 - fade), 0])
+                lines_group[i - 1].set_progress(max(alpha - 0.6, 0.0) / 0.4)
+            settled[0] = max(settled[0], int(value) + 1)
+
+        triangle = VGroup(lines_group, visual_rows)
+        triangle.add_updater(grow)
+        self.add(triangle)
+        if len(rows) > 1:
+            self.play(growth.animate.set_value(len(rows) - 1), run_time=ROW_TIME * (len(rows) - 1), rate_func=linear)
+        triangle.clear_updaters()
+        grow(triangle)
 
         self.wait(1)
 
@@ -0,0 +1,73 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+from meru_engine import parity_rows
+
+
+# --- HELPERS ---
+
+def hex_to_rgb(color):
+    color = color.lstrip("#")
+    return np.array([int(color[i:i + 2], 16) for i in (0, 2, 4)], dtype=np.float64)
+
+
+def _cell_layout(n_rows):
+    # Cell (n, k) covers pixels [x, x + 1] of image row n, with x = (n_rows - 1 - n) + 2k.
+    # That is the usual brick layout of the triangle, 2 pixels per cell.
+    n = np.arange(n_rows)[:, None]
+    k = np.arange(n_rows)[None, :]
+    inside = k <= n
+    x = (n_rows - 1 - n) + 2 * k
+    return n, k, inside, x
+
+
+def _paint(n_rows, rgba_cells):
+    # rgba_cells: (n_rows, n_rows, 4) float in 0..255, one colour per (n, k)
+    n, k, inside, x = _cell_layout(n_rows)
+    image = np.zeros((n_rows, 2 * n_rows, 4), dtype=np.uint8)
+    rows = np.broadcast_to(n, inside.shape)[inside]
+    cols = x[inside]
+    values = np.rint(rgba_cells[inside]).astype(np.uint8)
+    image[rows, cols] = values
+    image[rows, cols + 1] = values
+    return image
+
+
+# --- IMAGES ---
+
+def log_binomials(n_rows):
+    """log C(n, k) for the first n_rows rows, -inf outside the triangle."""
+    log_fact = np.concatenate([[0.0], np.cumsum(np.log(np.arange(1, n_rows)))])
+    n = np.arange(n_rows)[:, None]
+    k = np.arange(n_rows)[None, :]
+    with np.errstate(invalid="ignore"):
+        values = log_fact[n] - log_fact[k] - log_fact[np.clip(n - k, 0, None)]
+    return np.where(k <= n, values, -np.inf)
+
+
+def magnitude_image(n_rows, color, min_alpha=0.25):
+    """RGBA triangle where each cell's brightness is its size relative to the row's middle."""
+    logs = log_binomials(n_rows)
+    row_max = logs.max(axis=1, keepdims=True)
+    # Middle entry of each row -> 1, edges fade towards min_alpha
+    relative = np.where(row_max > 0, logs / np.where(row_max > 0, row_max, 1), 1.0)
+    relative = np.clip(np.nan_to_num(relative, neginf=0.0), 0.0, 1.0)
+
+    cells = np.empty((n_rows, n_rows, 4))
+    cells[..., :3] = hex_to_rgb(color)
+    cells[..., 3] = 255 * (min_alpha + (1 - min_alpha) * relative)
+    return _paint(n_rows, cells)
+
+
+def parity_image(n_rows, odd_color, even_color, even_alpha=0.1):
+    """RGBA Sierpinski triangle: odd cells in odd_color, even cells dimmed."""
+    odd = parity_rows(n_rows)
+    cells = np.empty((n_rows, n_rows, 4))
+    cells[...] = np.append(hex_to_rgb(even_color), 255 * even_alpha)
+    cells[odd] = np.append(hex_to_rgb(odd_color), 255.0)
+    return _paint(n_rows, cells)
@@ -0,0 +1,130 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import math
+
+import numpy as np
+
+from meru_engine import meru_row
+
+# Multi-way branching: a step moves 0, 1, ..., K-1 lateral units with weights
+# w_0 .. w_{K-1}. After n steps the lateral position is distributed like the
+# coefficients of (w_0 + w_1 x + ... + w_{K-1} x^{K-1})^n. With weights (1, 1)
+# that is Meru row n; with (1, 1, 1) it is row n of the trinomial triangle,
+# i.e. layer n of the Pascal pyramid summed along one axis.
+
+
+# --- ONE ROW, FLOAT (FFT repeated squaring) ---
+
+def _fft_multiply(a, b):
+    size = len(a) + len(b) - 1
+    n_fft = 1 << (size - 1).bit_length()
+    product = np.fft.irfft(np.fft.rfft(a, n_fft) * np.fft.rfft(b, n_fft), n_fft)[:size]
+    # Round-off shows up as tiny negative values in the far tails
+    np.maximum(product, 0.0, out=product)
+    return product / product.sum()
+
+
+def multinomial_row(n, weights=(1, 1, 1), exact=False):
+    """
+    Row n of (w_0 + w_1 x + ... + w_{K-1} x^{K-1})^n, length (K - 1) n + 1.
+
+    Default: float probabilities (the row divided by its sum, so nothing
+    overflows), by repeated squaring with FFT products; O(n log n) in total,
+    milliseconds for n in the tens of thousands. Tail values below ~1e-16 of
+    the peak are round-off. exact=True returns Python ints (integer weights).
+    """
+    if n < 0:
+        raise ValueError("row index must be non-negative")
+    if exact:
+        return multinomial_row_exact(n, weights)
+
+    base = np.asarray(weights, dtype=float)
+    base = base / base.sum()
+    row = np.ones(1)
+    while n:
+        if n & 1:
+            row = _fft_multiply(row, base)
+        n >>= 1
+        if n:
+            base = _fft_multiply(base, base)
+    return row
+
+
+# --- ONE ROW, EXACT (big ints) ---
+
+def multinomial_row_exact(n, weights=(1, 1, 1)):
+    """
+    Exact row as a tuple of ints, O(K) big-int operations per coefficient.
+
+    Uses the recurrence from P (P^n)' = n P' P^n (J. C. P. Miller):
+    j w_0 a_j = sum_{i=1..K-1} ((n + 1) i - j) w_i a_{j-i}, with a_0 = w_0^n.
+    For weights (1, 1) this is the Meru rule C(n, j) = C(n, j-1) (n - j + 1) / j.
+    """
+    weights = [int(w) for w in weights]
+    while len(weights) > 1 and weights[-1] == 0:
+        weights.pop()
+    if weights[0] == 0:
+        # x divides the polynomial: shift the row of the rest
+        shift = next((i for i, w in enumerate(weights) if w), None)
+        if shift is None:
+            return (0,) if n else (1,)
+        return (0,) * (shift * n) + multinomial_row_exact(n, weights[shift:])
+    if len(weights) == 2 and weights == [1, 1]:
+        return meru_row(n)
+
+    k = len(weights) - 1
+    w0 = weights[0]
+    row = [w0 ** n]
+    for j in range(1, k * n + 1):
+        total = 0
+        for i in range(1, min(k, j) + 1):
+            total += ((n + 1) * i - j) * weights[i] * row[j - i]
+        row.append(total // (j * w0))
+    return tuple(row)
+
+
+# --- ALL ROWS UP TO n_max (small n, one convolution per step) ---
+
+def multinomial_rows(n_max, weights=(1, 1, 1)):
+    """[row 0, ..., row n_max] as float probabilities; row t has (K - 1) t + 1 entries."""
+    base = np.asarray(weights, dtype=float)
+    base = base / base.sum()
+    rows = [np.ones(1)]
+    for _ in range(n_max):
+        rows.append(np.convolve(rows[-1], base))
+    return rows
+
+
+def branch_moments(weights):
+    """Mean and variance of one step's lateral move, in units of K - 1 moves (0..1)."""
+    w = np.asarray(weights, dtype=float)
+    w = w / w.sum()
+    moves = np.arange(len(w)) / (len(w) - 1)
+    mean = float(moves @ w)
+    return mean, float((moves ** 2) @ w - mean ** 2)
+
+
+# --- PASCAL PYRAMID (trinomial layers, exact) ---
+
+def pascal_pyramid_layer(n):
+    """
+    Layer n of the Pascal pyramid: layer[a][b] = n! / (a! b! (n - a - b)!)
+    for a + b <= n (a triangle of rows, row a has n - a + 1 entries).
+    Built from Meru rows: C(n, a) * C(n - a, b).
+    """
+    top = meru_row(n)
+    return [tuple(top[a] * c for c in meru_row(n - a)) for a in range(n + 1)]
+
+
+def multinomial_coefficient(counts):
+    """(sum counts)! / prod(count!) as a product of binomials."""
+    total = 0
+    result = 1
+    for count in counts:
+        total += count
+        result *= math.comb(total, count)
+    return result
@@ -0,0 +1,103 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from manim import *
+import numpy as np
+from glyph_cache import cached_math_tex
+from multinomial_engine import multinomial_row, multinomial_row_exact, pascal_pyramid_layer
+
+
+class PascalPyramidLayers(Scene):
+    # Size knobs: pyramid layers shown one by one, and the far row drawn as a curve
+    n_layers = 5
+    far_row = 20_000
+
+    def construct(self):
+        # --- CINEMATIC CONFIGURATION ---
+        self.camera.background_color = "#00020A"
+        MERU_GOLD = "#FFD700"
+        LAYER_COLOR = "#00FFFF"
+        TRI_COLOR = "#FF9F1C"
+
+        title = Text("Pascal's Pyramid: Meru with Three Branches", font_size=30, color=MERU_GOLD).to_edge(UP, buff=0.4)
+        self.play(Write(title))
+
+        # --- LAYERS OF (x + y + z)^n ---
+        # layer[a][b] = n! / (a! b! c!), drawn as a triangle (row a, column b)
+        def layer_mobject(n):
+            layer = pascal_pyramid_layer(n)
+            pitch = min(0.9, 4.2 / (n + 1))
+            font_size = min(32, 140 / (n + 1))
+            cells = VGroup(*[
+                cached_math_tex(str(value), color=LAYER_COLOR, font_size=font_size)
+                .move_to([(b - (n - a) / 2) * pitch, -a * pitch * 0.85, 0])
+                for a, row in enumerate(layer) for b, value in enumerate(row)
+            ])
+            return cells.move_to(DOWN * 0.3)
+
+        def layer_caption(n):
+            return MathTex(r"(x+y+z)^{" + str(n) + r"}", r"\quad \Sigma = 3^{" + str(n) + r"} = " + str(3 ** n),
+                           font_size=30, color=WHITE).to_edge(DOWN, buff=0.6)
+
+        layer = layer_mobject(0)
+        caption = layer_caption(0)
+        self.play(FadeIn(layer, scale=0.5), Write(caption))
+        self.wait(0.5)
+
+        for n in range(1, self.n_layers):
+            next_layer, next_caption = layer_mobject(n), layer_caption(n)
+            self.play(
+                ReplacementTransform(layer, next_layer),
+                ReplacementTransform(caption, next_caption),
+                run_time=1.2
+            )
+            layer, caption = next_layer, next_caption
+            self.wait(0.6)
+
+        # --- LEFT / STRAIGHT / RIGHT: the trinomial row ---
+        # Counting only the lateral position collapses a layer into one row of (1 + x + x^2)^n
+        n = self.n_layers - 1
+        tri_row = multinomial_row_exact(n, (1, 1, 1))
+        tri_mob = VGroup(*[cached_math_tex(str(value), color=TRI_COLOR, font_size=32) for value in tri_row])
+        tri_mob.arrange(RIGHT, buff=0.35).move_to(DOWN * 0.3)
+        tri_caption = MathTex(r"(1 + x + x^2)^{" + str(n) + "}", font_size=30, color=TRI_COLOR).to_edge(DOWN, buff=0.6)
+
+        self.play(ReplacementTransform(layer, tri_mob), ReplacementTransform(caption, tri_caption), run_time=1.5)
+        self.wait(1)
+
+        # --- FAR ROW (FFT repeated squaring, float probabilities) ---
+        far = self.far_row
+        probs = multinomial_row(far, (1, 1, 1))
+        center = len(probs) // 2
+        sd = np.sqrt(2 * far / 3)
+        window = np.arange(max(0, int(center - 5 * sd)), min(len(probs), int(center + 5 * sd) + 1))
+        # At most ~400 vertices on screen, however long the row is
+        window = window[::max(1, len(window) // 400)]
+
+        axes = Axes(
+            x_range=[-5, 5, 1],
+            y_range=[0, 1.1, 0.5],
+            x_length=8,
+            y_length=3.2,
+            axis_config={"color": "#334455", "stroke_width": 2, "include_tip": False},
+        ).move_to(DOWN * 0.5)
+        curve = VMobject(color=TRI_COLOR, stroke_width=3)
+        curve.set_points_as_corners([
+            axes.c2p(z, p) for z, p in zip((window - center) / sd, probs[window] / probs.max())
+        ])
+        far_caption = Text(
+            "Row {:,} of (1 + x + x²)^n: {:,} coefficients".format(far, len(probs)),
+            font_size=20, color=TRI_COLOR
+        ).to_edge(DOWN, buff=0.6)
+
+        self.play(FadeOut(tri_mob), ReplacementTransform(tri_caption, far_caption), Create(axes))
+        self.play(Create(curve), run_time=2)
+
+        conclusion = Text("Three branches, same bell: Meru in any dimension", font_size=22, color=WHITE)
+        conclusion.next_to(title, DOWN, buff=0.3)
+        self.play(Write(conclusion))
+
+        self.wait(3)
@@ -0,0 +1,126 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+
+LAGHU = "|"  # short syllable, bit 0
+GURU = "S"   # long syllable, bit 1
+
+# Binary digit <-> Pingala symbol
+_TO_SYMBOLS = str.maketrans("01", LAGHU + GURU)
+_TO_BINARY = str.maketrans(LAGHU + GURU, "01")
+
+
+def pattern_count(n):
+    return 2 ** n if n > 0 else 1
+
+
+def pingala_pattern(index, n):
+    """
+    Pattern number `index` (0-based) of length n, in the classic Prastara order:
+    all patterns starting with "|" first, then all starting with "S".
+    That is just index written as n binary digits, 0 -> "|" and 1 -> "S".
+    """
+    if n <= 0:
+        return ""
+    if not 0 <= index < 2 ** n:
+        raise IndexError(f"pattern index {index} out of range for n={n}")
+    return format(index, "0{}b".format(n)).translate(_TO_SYMBOLS)
+
+
+def iter_pingala_patterns(n, start=0, stop=None):
+    """
+    Lazily yield patterns start .. stop - 1 of length n (default: all 2^n).
+    Only one string is alive at a time, so n = 20+ streams in constant memory.
+    """
+    total = pattern_count(n)
+    stop = total if stop is None else min(stop, total)
+    if n <= 0:
+        if start <= 0 < stop:
+            yield ""
+        return
+
+    fmt = "0{}b".format(n)
+    for index in range(max(start, 0), stop):
+        yield format(index, fmt).translate(_TO_SYMBOLS)
+
+
+# --- UDDISTA / NASTA (pattern <-> index, O(n)) ---
+# Pingala's uddista finds the row of a given pattern in the prastara and
+# nasta rebuilds the pattern of a given row. In this project's order
+# (index 0 = all "|", first syllable = highest bit) both are binary conversions.
+
+def uddista(pattern):
+    """Index (0-based) of a pattern, e.g. uddista("|S|") == 2."""
+    if not pattern:
+        return 0
+    # Checked before translating, so raw binary such as "01" is rejected too
+    if set(pattern) - {LAGHU, GURU}:
+        raise ValueError(f"not a Pingala pattern: {pattern!r}")
+    return int(pattern.translate(_TO_BINARY), 2)
+
+
+def nasta(index, n):
+    """Pattern at a given index; same as pingala_pattern(index, n)."""
+    return pingala_pattern(index, n)
+
+
+# --- BATCHED (NumPy) VARIANTS, n <= 64 ---
+
+def _check_width(n):
+    if not 0 < n <= 64:
+        raise ValueError("batched uddista/nasta support 1 <= n <= 64 (use uddista/nasta for more)")
+
+
+def nasta_bits(indices, n):
+    """(len(indices), n) uint8 bit array, first syllable first (1 = guru)."""
+    _check_width(n)
+    indices = np.asarray(indices, dtype=np.uint64)
+    shifts = np.arange(n - 1, -1, -1, dtype=np.uint64)
+    return ((indices[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+
+
+def uddista_bits(bits):
+    """uint64 indices of a (count, n) bit array; inverse of nasta_bits."""
+    bits = np.asarray(bits, dtype=np.uint64)
+    n = bits.shape[1]
+    _check_width(n)
+    shifts = np.arange(n - 1, -1, -1, dtype=np.uint64)
+    return np.bitwise_or.reduce(bits << shifts, axis=1)
+
+
+def bits_to_patterns(bits):
+    """Bit rows -> list of "|"/"S" strings in one bytes conversion."""
+    bits = np.asarray(bits, dtype=np.uint8)
+    count, n = bits.shape
+    chars = np.where(bits.astype(bool), ord(GURU), ord(LAGHU)).astype(np.uint8).tobytes().decode("ascii")
+    return [chars[i * n:(i + 1) * n] for i in range(count)]
+
+
+def patterns_to_bits(patterns):
+    """Equal-length "|"/"S" strings -> (count, n) uint8 bit array."""
+    patterns = list(patterns)
+    if not patterns:
+        return np.zeros((0, 0), dtype=np.uint8)
+    n = len(patterns[0])
+    if any(len(pattern) != n for pattern in patterns):
+        raise ValueError("patterns must all have the same length")
+    # Non-ASCII symbols become "?" and fail the check below
+    raw = np.frombuffer("".join(patterns).encode("ascii", errors="replace"), dtype=np.uint8)
+    guru = raw == ord(GURU)
+    if not (guru | (raw == ord(LAGHU))).all():
+        raise ValueError(f"not Pingala patterns: symbols other than {LAGHU!r} and {GURU!r}")
+    return guru.astype(np.uint8).reshape(len(patterns), n)
+
+
+def nasta_batch(indices, n):
+    """Many indices -> patterns (n <= 64)."""
+    return bits_to_patterns(nasta_bits(indices, n))
+
+
+def uddista_batch(patterns):
+    """Many equal-length patterns -> uint64 indices (n <= 64)."""
+    return uddista_bits(patterns_to_bits(patterns))
@@ -0,0 +1,107 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import math
+
+import numpy as np
+
+from manim import GRAY_B, Text, ValueTracker, VGroup
+
+
+class VirtualScroller(VGroup):
+    """
+    Windowed column of text lines (e.g. Pingala patterns) that scrolls upwards.
+
+    Only the lines inside `window` (plus `buffer_lines` above and below) exist
+    as mobjects. Line i sits at window bottom + (offset - i) * spacing, so
+    animating `offset` from 0 to `end_offset` runs the whole list through the
+    window. Slots that scroll out are recycled for the next lines by copying
+    per-character glyph templates, so no new Pango text is built per frame.
+
+    Lines are monospaced strings over a small alphabet ("|S" for Pingala).
+    """
+
+    def __init__(self, line_for, n_lines, window, alphabet="|S", line_length=None,
+                 spacing=0.45, buffer_lines=2, font="Courier New", font_size=20, color=GRAY_B,
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.line_for = line_for
+        self.n_lines = n_lines
+        self.window = window
+        self.spacing = spacing
+        self.buffer_lines = buffer_lines
+        self.offset = ValueTracker(0)
+
+        if line_length is None:
+            line_length = max(len(line_for(0)), len(line_for(n_lines - 1))) if n_lines else 1
+        self.line_length = line_length
+
+        # Glyph j of template[ch] is character ch at column j, placed by Pango
+        self.templates = {
+            ch: Text(ch * line_length, font=font, font_size=font_size, color=color)
+            for ch in alphabet
+        }
+        first_template = self.templates[alphabet[0]]
+        self.template_center = first_template.get_center()
+
+        self.visible_lines = math.ceil(window.height / spacing)
+        pool_size = self.visible_lines + 1 + 2 * buffer_lines
+        for _ in range(pool_size):
+            slot = first_template.copy()
+            slot.index = None
+            slot.chars = [None] * line_length
+            slot.displacement = np.zeros(3)
+            slot.set_opacity(0)
+            self.add(slot)
+
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    @property
+    def end_offset(self):
+        # Offset at which the last line has left the top of the window
+        return self.n_lines + self.visible_lines + 1
+
+    def scroll_to_end(self):
+        return self.offset.animate.set_value(self.end_offset)
+
+    def _fill_slot(self, slot, index):
+        line = self.line_for(index)
+        for j in range(self.line_length):
+            ch = line[j] if j < len(line) else None
+            if ch == slot.chars[j]:
+                continue
+            if ch is None:
+                slot[j].set_opacity(0)
+            else:
+                slot[j].become(self.templates[ch][j]).shift(slot.displacement)
+            slot.chars[j] = ch
+        slot.index = index
+
+    def refresh(self):
+        offset = self.offset.get_value()
+        bottom = self.window.get_bottom()[1]
+        center_x = self.window.get_center()[0]
+
+        first = math.floor(offset) - self.visible_lines - self.buffer_lines
+        for index in range(first, first + len(self.submobjects)):
+            slot = self.submobjects[index % len(self.submobjects)]
+            if not 0 <= index < self.n_lines:
+                if slot.index is not None:
+                    slot.set_opacity(0)
+                    slot.index = None
+                    slot.chars = [None] * self.line_length
+                continue
+
+            if slot.index != index:
+                self._fill_slot(slot, index)
+
+            # Move the slot from its current place to line `index`'s place
+            y = bottom + (offset - index) * self.spacing
+            displacement = np.array([center_x, y, 0.0]) - self.template_center
+            slot.shift(displacement - slot.displacement)
+            slot.displacement = displacement
+        return self
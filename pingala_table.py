@@ -5,20 +5,23 @@ License: MIT License (See LICENSE file for details)
 YouTube: https://www.youtube.com/@MathRize
 """
 from manim import *
+from matra_meru import MatraMeru, matra_count
+from pingala_patterns import iter_pingala_patterns, nasta_batch, pingala_pattern, uddista
+from pingala_scroller import VirtualScroller
 
 class PingalaCinematicTableCentered(Scene):
+    # Size knob: pattern lengths shown in the scrolling column, in order
+    scroll_lengths = (7, 8)
+
     def construct(self):
         # --- CONFIGURATION ---
         W = config.frame_width
         H = config.frame_height
 
         # --- HELPER FUNCTION ---
+        # Small rows are still shown in full; the generator is lazy and index-based
         def get_pingala_patterns(n):
-            if n <= 0: return [""]
-            if n == 1: return ["|", "S"]
-            prev_patterns = get_pingala_patterns(n - 1)
-            new_patterns = ["|" + p for p in prev_patterns] + ["S" + p for p in prev_patterns]
-            return new_patterns
+            return list(iter_pingala_patterns(n))
 
         # --- TITLE ---
         title = Title(r"Pingala's Chandahśāstra: The Binary Growth")
@@ -92,15 +95,24 @@ class PingalaCinematicTableCentered(Scene):
         n_display.add_updater(lambda d: d.set_value(n_tracker.get_value()))
         total_display.add_updater(lambda d: d.set_value(2**int(n_tracker.get_value())))
 
-        huge_pattern_list = get_pingala_patterns(7) + get_pingala_patterns(8)
-        scrolling_text_str = "\n".join(huge_pattern_list)
-        # Matrix style binary column
-        scrolling_column = Text(scrolling_text_str, font="Courier New", font_size=20, line_spacing=1.5, color=GRAY_B)
-        
+        scroll_counts = [2 ** n for n in self.scroll_lengths]
+        max_n = max(self.scroll_lengths)
+
+        def scroll_line(index):
+            # Global line index -> pattern, without building any list
+            for n, count in zip(self.scroll_lengths, scroll_counts):
+                if index < count:
+                    return pingala_pattern(index, n)
+                index -= count
+
         scroll_window_box = Rectangle(width=4, height=4, color=WHITE).move_to(ORIGIN)
         scroll_window_box.set_stroke(opacity=0) 
 
-        scrolling_column.next_to(scroll_window_box, DOWN, buff=1)
+        # Matrix style binary column (virtualized: only lines near the window exist)
+        scrolling_column = VirtualScroller(
+            scroll_line, sum(scroll_counts), scroll_window_box,
+            font="Courier New", font_size=20, spacing=0.45, color=GRAY_B
+        )
         
         mask_rect_top = Rectangle(width=W, height=H/2 + 2, fill_color=BLACK, fill_opacity=1, stroke_opacity=0)
         mask_rect_top.next_to(scroll_window_box, UP, buff=0)
@@ -115,16 +127,16 @@ class PingalaCinematicTableCentered(Scene):
         self.add(scrolling_column) 
 
         self.play(
-            n_tracker.animate.set_value(8),
-            scrolling_column.animate.move_to(UP * 20), 
+            n_tracker.animate.set_value(max_n),
+            scrolling_column.scroll_to_end(), 
             run_time=6,
             rate_func=linear 
         )
 
         n_display.clear_updaters()
         total_display.clear_updaters()
-        n_display.set_value(8)
-        total_display.set_value(256)
+        n_display.set_value(max_n)
+        total_display.set_value(2 ** max_n)
         self.wait(1)
 
         # --- FINAL REVEAL ---
@@ -141,3 +153,161 @@ class PingalaCinematicTableCentered(Scene):
 
 
         self.wait(3)
+
+
+class PingalaMatraMeruScroll(Scene):
+    # Size knobs: beats (morae) of the meters in the scrolling column, and the
+    # most lines it scrolls (larger prastaras are sampled evenly, first and last kept)
+    mora_count = 24
+    max_scroll_lines = 10_000
+
+    def construct(self):
+        # --- CONFIGURATION ---
+        W = config.frame_width
+        H = config.frame_height
+        n_max = self.mora_count
+
+        # --- TITLE ---
+        title = Title(r"Mātrā-Meru: Counting Meters by Beats")
+        self.play(Write(title))
+
+        rule = Text("| = 1 beat (laghu)      S = 2 beats (guru)", font="Courier New", font_size=26, color=BLUE)
+        rule.next_to(title, DOWN, buff=0.6)
+        self.play(FadeIn(rule))
+        self.wait(0.5)
+
+        scroll_label = Text("Meters of {} beats...".format(n_max), color=RED, font_size=32).next_to(rule, DOWN, buff=0.3)
+
+        n_tracker = ValueTracker(1)
+
+        n_display = Integer(number=1, font_size=60, color=BLUE).move_to(LEFT*4)
+        n_label = Text("Beats (n):", font_size=24).next_to(n_display, UP)
+
+        total_display = Integer(number=1, font_size=60, color=YELLOW).move_to(RIGHT*4)
+        total_label = Text("Total Meters:", font_size=24).next_to(total_display, UP)
+
+        # Counts come from fast doubling (Fibonacci), never from enumeration
+        n_display.add_updater(lambda d: d.set_value(n_tracker.get_value()))
+        total_display.add_updater(lambda d: d.set_value(matra_count(int(n_tracker.get_value()))))
+
+        # Index -> meter, O(n) per visible line; the full list is never built
+        meters = MatraMeru(n_max)
+        # F(n + 1) meters outgrow a float scroll offset (and len()) long before
+        # they outgrow the screen: scroll at most max_scroll_lines of them
+        n_lines = min(meters.total, max(self.max_scroll_lines, 2))
+
+        def meter_line(line):
+            if n_lines == meters.total:
+                return meters[line]
+            # Exact big-int position of the sampled meter
+            return meters[line * (meters.total - 1) // (n_lines - 1)]
+
+        scroll_window_box = Rectangle(width=4, height=3.2, color=WHITE).move_to(DOWN*0.8)
+        scroll_window_box.set_stroke(opacity=0)
+
+        scrolling_column = VirtualScroller(
+            meter_line, n_lines, scroll_window_box,
+            line_length=n_max, font="Courier New", font_size=18, spacing=0.4, color=GRAY_B
+        )
+
+        mask_rect_top = Rectangle(width=W, height=H/2 + 2, fill_color=BLACK, fill_opacity=1, stroke_opacity=0)
+        mask_rect_top.next_to(scroll_window_box, UP, buff=0)
+
+        mask_rect_bottom = Rectangle(width=W, height=H/2 + 2, fill_color=BLACK, fill_opacity=1, stroke_opacity=0)
+        mask_rect_bottom.next_to(scroll_window_box, DOWN, buff=0)
+
+        self.add_foreground_mobject(mask_rect_bottom)
+        # Title, rule and counters stay above the top mask
+        self.add_foreground_mobject(mask_rect_top)
+        self.add_foreground_mobjects(title, rule, scroll_label, n_display, n_label, total_display, total_label)
+
+        self.play(Write(scroll_label), FadeIn(n_display), FadeIn(total_display), FadeIn(n_label), FadeIn(total_label))
+        self.add(scrolling_column)
+
+        self.play(
+            n_tracker.animate.set_value(n_max),
+            scrolling_column.scroll_to_end(),
+            run_time=8,
+            rate_func=linear
+        )
+
+        n_display.clear_updaters()
+        total_display.clear_updaters()
+        n_display.set_value(n_max)
+        total_display.set_value(matra_count(n_max))
+        self.wait(1)
+
+        # --- FINAL REVEAL ---
+        self.remove(mask_rect_top, mask_rect_bottom, scrolling_column)
+        self.play(
+            FadeOut(scroll_label), FadeOut(n_display), FadeOut(total_display), FadeOut(n_label), FadeOut(total_label), FadeOut(rule)
+        )
+
+        math_display = MathTex(r"M_n = M_{n-1} + M_{n-2}", font_size=80, color=YELLOW).move_to(ORIGIN)
+        final_text = Text("Pingala's Matra-Meru = Fibonacci", font_size=36, color=BLUE).next_to(math_display, UP, buff=0.6)
+        self.play(Write(final_text), Write(math_display))
+
+        box = SurroundingRectangle(math_display, color=YELLOW, buff=0.4)
+        self.play(Create(box))
+
+        self.wait(3)
+
+
+class PingalaNastaJump(Scene):
+    # Size knobs: syllables per pattern (batched nasta supports up to 64), jump targets
+    pattern_length = 64
+    jump_indices = (0, 1, 2**32 + 7, 2**63, 2**64 - 1, 12345678901234567890)
+
+    def construct(self):
+        # --- CONFIGURATION ---
+        W = config.frame_width
+        n = self.pattern_length
+        total = 2 ** n
+        indices = [i for i in self.jump_indices if i < total]
+
+        # --- TITLE ---
+        title = Title(r"Naṣṭa: Jumping to Any Row of the Prastāra")
+        self.play(Write(title))
+
+        count_text = MathTex(r"2^{" + str(n) + r"} = " + "{:,}".format(total).replace(",", r"\,"), font_size=40, color=YELLOW)
+        count_text.next_to(title, DOWN, buff=0.5)
+        self.play(Write(count_text))
+
+        # Every target pattern in one batched index -> bits conversion
+        patterns = nasta_batch(indices, n)
+
+        def index_line(index):
+            return Text("Row #{:,}".format(index), font_size=28, color=BLUE).move_to(UP * 0.6)
+
+        def pattern_line(pattern):
+            line = Text(pattern, font="Courier New", font_size=22, color=GRAY_B)
+            return line.scale_to_fit_width(min(line.width, W - 1)).move_to(DOWN * 0.4)
+
+        def check_line(pattern):
+            # Uddista reads the row number back from the pattern
+            return Text("uddista -> {:,}".format(uddista(pattern)), font_size=20, color=GREEN).move_to(DOWN * 1.6)
+
+        index_text = index_line(indices[0])
+        pattern_text = pattern_line(patterns[0])
+        check_text = check_line(patterns[0])
+        self.play(FadeIn(index_text), Write(pattern_text), FadeIn(check_text))
+        self.wait(1)
+
+        # --- JUMPS (O(n) per row, the prastara is never listed) ---
+        for index, pattern in zip(indices[1:], patterns[1:]):
+            self.play(
+                Transform(index_text, index_line(index)),
+                Transform(pattern_text, pattern_line(pattern)),
+                Transform(check_text, check_line(pattern)),
+                run_time=1.2
+            )
+            self.wait(0.8)
+
+        # --- FINAL REVEAL ---
+        self.play(FadeOut(index_text), FadeOut(pattern_text), FadeOut(check_text), FadeOut(count_text))
+        math_display = Text("| = 0,  S = 1:  row number = pattern in binary", font_size=30, color=YELLOW)
+        box = SurroundingRectangle(math_display, color=YELLOW, buff=0.4)
+        self.play(Write(math_display))
+        self.play(Create(box))
+
+        self.wait(3)
@@ -0,0 +1,83 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import numpy as np
+from manim import Animation, VMobject
+
+
+# --- POLYLINES AS BEZIER SUBPATHS ---
+
+def _to_3d(tracks):
+    tracks = np.asarray(tracks, dtype=float)
+    if tracks.shape[-1] == 2:
+        tracks = np.concatenate([tracks, np.zeros(tracks.shape[:-1] + (1,))], axis=-1)
+    return tracks
+
+
+def tracks_to_bezier_points(tracks, time_major=False):
+    """
+    Straight-segment cubic Bezier control points for a multi-subpath VMobject,
+    from polylines shaped (paths, points, 2 or 3). Returns (n_segments * 4, 3)
+    points. By default the segments are stored path by path, so each polyline
+    is one subpath with joined corners. With time_major=True the segments of
+    step 1 for all paths come first; consecutive segments then belong to
+    different paths, so every segment is a subpath of its own (no joins).
+    """
+    tracks = _to_3d(tracks)
+    starts = tracks[:, :-1]
+    ends = tracks[:, 1:]
+    if time_major:
+        starts = starts.swapaxes(0, 1)
+        ends = ends.swapaxes(0, 1)
+
+    curves = np.empty(starts.shape[:2] + (4, 3))
+    curves[..., 0, :] = starts
+    curves[..., 1, :] = (2 * starts + ends) / 3
+    curves[..., 2, :] = (starts + 2 * ends) / 3
+    curves[..., 3, :] = ends
+    return curves.reshape(-1, 3)
+
+
+class TrackPaths(VMobject):
+    """
+    Many polylines (paths, points, 2 or 3) in one VMobject, one subpath per
+    path. set_progress(alpha) draws every path up to the same fraction of its
+    segments, which is what GrowTracks animates: all paths grow together and
+    each one stays a single stroke.
+    """
+
+    def __init__(self, tracks, **kwargs):
+        super().__init__(**kwargs)
+        self.tracks = _to_3d(tracks)
+        self.set_progress(1.0)
+
+    def set_progress(self, alpha):
+        self.progress = alpha
+        tracks = self.tracks
+        n_segments = tracks.shape[1] - 1
+        position = min(max(alpha, 0.0), 1.0) * n_segments
+        full = int(position)
+        if full < n_segments:
+            # Whole segments so far, then the current one cut at its local progress
+            tip = tracks[:, full] + (position - full) * (tracks[:, full + 1] - tracks[:, full])
+            tracks = np.concatenate([tracks[:, :full + 1], tip[:, None]], axis=1)
+        self.set_points(tracks_to_bezier_points(tracks))
+        return self
+
+
+class GrowTracks(Animation):
+    """Create-style animation for TrackPaths: every path grows from its first point at once."""
+
+    def __init__(self, paths, **kwargs):
+        kwargs.setdefault("introducer", True)
+        super().__init__(paths, **kwargs)
+
+    def begin(self):
+        self.mobject.set_progress(0.0)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.mobject.set_progress(self.rate_func(alpha))
@@ -0,0 +1,165 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+import csv
+import itertools
+import os
+from pathlib import Path
+
+import numpy as np
+
+# Lines parsed per CSV chunk
+CHUNK_ROWS = 1_000_000
+
+
+# --- LOADING ---
+
+def _cache_path(path, column):
+    return path.with_name("{}.{}.npy".format(path.name, column))
+
+
+class _ColumnFile:
+    """
+    float64 column written into a .npy file chunk by chunk, so only one chunk
+    is ever in memory. The file starts at the expected row count and is
+    reallocated (doubling, copied a chunk at a time) when more rows arrive;
+    close() trims it to the rows written.
+    """
+
+    def __init__(self, path, capacity):
+        self.path = Path(path)
+        self.count = 0
+        self.data = np.lib.format.open_memmap(self.path, mode="w+", dtype=np.float64, shape=(max(capacity, 1),))
+
+    def _resize(self, capacity):
+        tmp = self.path.with_suffix(".grow.npy")
+        resized = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float64, shape=(capacity,))
+        for lo in range(0, self.count, CHUNK_ROWS):
+            hi = min(lo + CHUNK_ROWS, self.count)
+            resized[lo:hi] = self.data[lo:hi]
+        resized.flush()
+        # Unmap both before renaming (Windows cannot replace a mapped file)
+        del resized
+        self.data = None
+        os.replace(tmp, self.path)
+        self.data = np.load(self.path, mmap_mode="r+")
+
+    def add(self, values):
+        end = self.count + len(values)
+        if end > len(self.data):
+            self._resize(max(end, 2 * len(self.data)))
+        self.data[self.count:end] = values
+        self.count = end
+
+    def close(self):
+        if self.count != len(self.data):
+            self._resize(self.count)
+        self.data.flush()
+        self.data = None
+
+
+def _stream_csv_column(path, column, chunk_rows, out_path):
+    """Parse one CSV column chunk_rows lines at a time into the .npy file out_path."""
+    with open(path, newline="") as handle:
+        header = next(csv.reader([handle.readline()]))
+        names = [name.strip().lower() for name in header]
+        if isinstance(column, str):
+            if column.lower() not in names:
+                raise ValueError("column {!r} not in {} (has {})".format(column, path.name, header))
+            index = names.index(column.lower())
+        else:
+            index = column
+
+        out = None
+        while True:
+            lines = list(itertools.islice(handle, chunk_rows))
+            if not lines:
+                break
+            values = np.loadtxt(lines, delimiter=",", usecols=(index,), dtype=np.float64, ndmin=1)
+            if out is None:
+                # Expected rows from the first chunk's bytes per line
+                per_line = sum(map(len, lines)) / len(lines)
+                out = _ColumnFile(out_path, int(path.stat().st_size / per_line * 1.05) + 1)
+            out.add(values)
+    if out is None:
+        np.save(out_path, np.empty(0))
+    else:
+        out.close()
+
+
+def load_price_series(path, column="close", chunk_rows=CHUNK_ROWS):
+    """
+    One price column as a read-only float64 array, memory-mapped from disk.
+
+    .npy files are mapped directly (2-D arrays: `column` must be the column
+    index, structured arrays: the field name). CSV files are parsed once in
+    chunks of chunk_rows lines straight into "<file>.<column>.npy" next to the
+    source, so memory stays at one chunk; later loads map that cache until the
+    CSV changes.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".npy":
+        data = np.load(path, mmap_mode="r")
+        if data.dtype.names:
+            return data[column]
+        if data.ndim == 2:
+            if not isinstance(column, int):
+                # A plain array has no column names to look up
+                raise ValueError("{} is a 2-D array without column names; pass column as an index".format(path.name))
+            return data[:, column]
+        return data
+
+    cache = _cache_path(path, column)
+    if not cache.is_file() or cache.stat().st_mtime < path.stat().st_mtime:
+        tmp = cache.with_suffix(".tmp.npy")
+        _stream_csv_column(path, column, chunk_rows, tmp)
+        os.replace(tmp, cache)
+    return np.load(cache, mmap_mode="r")
+
+
+# --- DOWNSAMPLING ---
+
+def lttb(y, n_out, x=None):
+    """
+    Largest-Triangle-Three-Buckets: indices of n_out points that keep the
+    visual shape of (x, y). First and last points are always kept. Each
+    bucket is read once as a slice, so memory-mapped input is streamed.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    chosen = np.empty(n_out, dtype=np.int64)
+    chosen[0] = 0
+    chosen[-1] = n - 1
+
+    def xs(lo, hi):
+        return np.arange(lo, hi, dtype=np.float64) if x is None else np.asarray(x[lo:hi], dtype=np.float64)
+
+    prev = 0
+    prev_x = float(prev if x is None else x[prev])
+    prev_y = float(y[prev])
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        # Average of the next bucket is the third triangle corner
+        nlo, nhi = edges[b + 1], (edges[b + 2] if b + 2 < len(edges) else n)
+        avg_x = xs(nlo, nhi).mean()
+        avg_y = float(np.mean(y[nlo:nhi]))
+
+        bucket_x = xs(lo, hi)
+        bucket_y = np.asarray(y[lo:hi], dtype=np.float64)
+        area = np.abs((prev_x - avg_x) * (bucket_y - prev_y) - (prev_x - bucket_x) * (avg_y - prev_y))
+        best = lo + int(area.argmax())
+
+        chosen[b + 1] = best
+        prev_x, prev_y = float(best if x is None else x[best]), float(y[best])
+    return chosen
+
+
+def pixel_budget(x_length, frame_width, pixel_width):
+    """Number of pixel columns an axis of x_length scene units covers."""
+    return max(3, int(round(pixel_width * x_length / frame_width)))
@@ -0,0 +1,118 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from fractions import Fraction
+
+import numpy as np
+from manim import VMobject
+
+from polyline_paths import TrackPaths
+
+
+# --- ROSE MATH (vectorized over t) ---
+
+def rose_period(k):
+    """Smallest theta range that closes r = cos(k theta); k may be a Fraction like 3/7."""
+    k = Fraction(k).limit_denominator(10000)
+    p, q = k.numerator, k.denominator
+    return (np.pi if (p * q) % 2 else 2 * np.pi) * q
+
+
+def rose_xy(t, k, a=1.0):
+    t = np.asarray(t, dtype=float)
+    r = a * np.cos(float(k) * t)
+    return np.stack([r * np.cos(t), r * np.sin(t)], axis=-1)
+
+
+def rose_curvature(t, k, a=1.0):
+    # Polar curvature |r^2 + 2 r'^2 - r r''| / (r^2 + r'^2)^(3/2), and speed ds/dt
+    k = float(k)
+    r = a * np.cos(k * t)
+    dr = -a * k * np.sin(k * t)
+    ddr = -a * k * k * np.cos(k * t)
+    speed = np.sqrt(r * r + dr * dr)
+    curvature = np.abs(r * r + 2 * dr * dr - r * ddr) / np.maximum(speed, 1e-12) ** 3
+    return curvature, speed
+
+
+def adaptive_rose_t(k, a=1.0, t_range=None, n_samples=800, curvature_weight=1.0, oversample=8):
+    """
+    n_samples t values spaced evenly in "cost" = integral of (1 + w * a * kappa) ds,
+    so petal tips (high curvature) get dense samples and flat stretches sparse ones.
+    """
+    t0, t1 = (0.0, rose_period(k)) if t_range is None else t_range
+    dense_t = np.linspace(t0, t1, n_samples * oversample)
+    curvature, speed = rose_curvature(dense_t, k, a)
+    # a * kappa is scale free, so the same weight works for any size
+    density = speed * (1.0 + curvature_weight * a * np.minimum(curvature, 1e3 / a))
+
+    cost = np.concatenate([[0.0], np.cumsum(0.5 * (density[1:] + density[:-1]) * np.diff(dense_t))])
+    targets = np.linspace(0.0, cost[-1], n_samples)
+    return np.interp(targets, cost, dense_t)
+
+
+def maurer_rose_xy(n, d, a=1.0, n_points=361):
+    """Maurer rose: the rose r = sin(n theta) visited at theta = 0, d, 2d, ... degrees."""
+    theta = np.radians(d * np.arange(n_points))
+    r = a * np.sin(n * theta)
+    return np.stack([r * np.cos(theta), r * np.sin(theta)], axis=-1)
+
+
+def _to_3d(xy):
+    return np.concatenate([xy, np.zeros(xy.shape[:-1] + (1,))], axis=-1)
+
+
+# --- MOBJECTS ---
+
+class RoseCurve(VMobject):
+    """r = a cos(k theta) evaluated on a NumPy t-array with curvature-adaptive samples."""
+
+    def __init__(self, k=5, a=1.0, t_range=None, n_samples=800, curvature_weight=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.k = k
+        self.a = a
+        t = adaptive_rose_t(k, a, t_range, n_samples, curvature_weight)
+        self.set_points_as_corners(_to_3d(rose_xy(t, k, a)))
+
+
+class MaurerRose(VMobject):
+    def __init__(self, n=6, d=71, a=1.0, n_points=361, **kwargs):
+        super().__init__(**kwargs)
+        self.set_points_as_corners(_to_3d(maurer_rose_xy(n, d, a, n_points)))
+
+
+class RoseGallery(TrackPaths):
+    """
+    Many roses in one VMobject (one subpath per k) laid out on a grid.
+    All curves share one sample count, so GrowTracks draws every rose at the
+    same time in a single pass.
+    """
+
+    def __init__(self, ks, a=0.6, cols=5, cell=1.5, n_samples=600, curvature_weight=1.0, **kwargs):
+        ks = list(ks)
+        rows = -(-len(ks) // cols)
+        curves = np.empty((len(ks), n_samples, 2))
+        cell_centers = []
+        for i, k in enumerate(ks):
+            t = adaptive_rose_t(k, a, None, n_samples, curvature_weight)
+            row, col = divmod(i, cols)
+            center = np.array([(col - (cols - 1) / 2) * cell, ((rows - 1) / 2 - row) * cell])
+            curves[i] = rose_xy(t, k, a) + center
+            cell_centers.append(np.append(center, 0.0))
+        super().__init__(curves, **kwargs)
+        self.ks = ks
+        self.cell_centers = cell_centers
+
+
+def gallery_ks(max_q=7, max_p=7):
+    """Rational petal ratios p/q (lowest terms) for a gallery, ordered by q then p."""
+    ks = []
+    for q in range(1, max_q + 1):
+        for p in range(1, max_p + 1):
+            if np.gcd(p, q) == 1:
+                ks.append(Fraction(p, q))
+    return ks
+
@@ -4,7 +4,8 @@ Project: The Code of Binary / Meru Prastara Visualization
 Copyright (c) 2026 Ruhani Kashni (MathRize)
 License: MIT License (See LICENSE file for details)
 YouTube: https://www.youtube.com/@MathRize
-"""from manim import *
+"""
+from manim import *
 
 class MeruPrastaraPro(Scene):
     def construct(self):
@@ -5,6 +5,7 @@ License: MIT License (See LICENSE file for details)
 YouTube: https://www.youtube.com/@MathRize
 """
 from manim import *
+from glyph_cache import cached_text
 
 class CinematicCombinatorics(Scene):
     def construct(self):
@@ -21,17 +22,17 @@ class CinematicCombinatorics(Scene):
         # Function to create "2 to the power of n" manually
         # -----------------------------------------
         def create_power(base_num, exp_num, result_num):
-            # Base "2"
-            base = Text(str(base_num), font_size=60, color=GOLD)
+            # Base "2" (cached: same glyphs are reused across cases)
+            base = cached_text(str(base_num), font_size=60, color=GOLD)
             # Exponent (Thoda chhota aur upar)
-            exponent = Text(str(exp_num), font_size=35, color=GOLD)
+            exponent = cached_text(str(exp_num), font_size=35, color=GOLD)
             exponent.next_to(base, UP + RIGHT, buff=0.05).shift(DOWN*0.2)
             
             # Equal sign
-            eq = Text("=", font_size=60, color=GOLD).next_to(base, RIGHT, buff=0.8)
+            eq = cached_text("=", font_size=60, color=GOLD).next_to(base, RIGHT, buff=0.8)
             
             # Result
-            res = Text(str(result_num), font_size=60, color=GOLD).next_to(eq, RIGHT, buff=0.5)
+            res = cached_text(str(result_num), font_size=60, color=GOLD).next_to(eq, RIGHT, buff=0.5)
             
             # Group them together
             return VGroup(base, exponent, eq, res)
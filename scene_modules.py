@@ -0,0 +1,191 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Helpers for tools that work on the scene files as a whole
+(benchmarks, batch rendering, the launcher): finding them, loading them,
+listing the scenes they define without importing them, and listing the
+local modules and asset files each one depends on.
+"""
+import ast
+import importlib.machinery
+import importlib.util
+import json
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+# Static scene index, rebuilt per file when its size or mtime changes
+INDEX_PATH = ROOT / "media" / "scene_index.json"
+INDEX_VERSION = 1
+
+# manim base classes a scene can derive from
+MANIM_SCENE_BASES = {
+    "Scene", "MovingCameraScene", "ThreeDScene", "SpecialThreeDScene",
+    "ZoomedScene", "VectorScene", "LinearTransformationScene",
+}
+
+ASSET_SUFFIXES = {".jpg", ".jpeg", ".png", ".svg", ".gif", ".mp3", ".wav", ".ttf", ".otf", ".csv", ".npy", ".npz"}
+
+
+def scene_files(root=ROOT):
+    """Python files plus suffix-less scripts (e.g. "Decoding Flower code") that use manim."""
+    files = []
+    for path in sorted(Path(root).iterdir()):
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        if path.suffix == ".py" or (not path.suffix and _looks_like_manim_script(path)):
+            files.append(path)
+    return files
+
+
+def _looks_like_manim_script(path):
+    try:
+        head = path.read_text(encoding="utf-8", errors="ignore")[:4096]
+    except OSError:
+        return False
+    return "from manim import" in head or "import manim" in head
+
+
+def load_module(path):
+    # Scene files are plain scripts; some have no .py suffix, so go through SourceFileLoader
+    path = Path(path)
+    name = "mathrize_" + "".join(ch if ch.isalnum() else "_" for ch in path.stem)
+    loader = importlib.machinery.SourceFileLoader(name, str(path))
+    spec = importlib.util.spec_from_loader(name, loader)
+    module = importlib.util.module_from_spec(spec)
+    # Registered like a normal import, so tools that patch project modules
+    # (draft_mode.draft_glyphs) and pickling see the scene module too
+    sys.modules[name] = module
+    try:
+        loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def parse_file(path):
+    return ast.parse(Path(path).read_text(encoding="utf-8"), filename=str(path))
+
+
+def local_dependencies(path, root=ROOT):
+    """The file itself plus every repo module it imports, transitively."""
+    root = Path(root)
+    seen = []
+    pending = [Path(path)]
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.append(current)
+        for node in ast.walk(parse_file(current)):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = root / (name.split(".")[0] + ".py")
+                if candidate.is_file():
+                    pending.append(candidate)
+    return sorted(seen)
+
+
+def asset_paths(path, root=ROOT):
+    """Asset files named by string literals in the file (e.g. "champa_cinematic.jpg")."""
+    root = Path(root)
+    assets = set()
+    for node in ast.walk(parse_file(path)):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and len(node.value) < 260:
+            if Path(node.value).suffix.lower() in ASSET_SUFFIXES:
+                assets.add(root / node.value)
+    return sorted(assets)
+
+
+# --- STATIC SCENE INDEX (no manim import) ---
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def class_bases(path):
+    """[(class name, [base names])] for the top-level classes of a file, in order."""
+    classes = []
+    for node in parse_file(path).body:
+        if isinstance(node, ast.ClassDef):
+            classes.append((node.name, [name for name in map(_base_name, node.bases) if name]))
+    return classes
+
+
+def _file_stamp(path):
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _load_index(index_path):
+    try:
+        index = json.loads(Path(index_path).read_text())
+    except (OSError, ValueError):
+        return {}
+    return index.get("files", {}) if index.get("version") == INDEX_VERSION else {}
+
+
+def _save_index(index_path, files):
+    index_path = Path(index_path)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = index_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"version": INDEX_VERSION, "files": files}, indent=1))
+    os.replace(tmp, index_path)
+
+
+def scene_index(root=ROOT, index_path=INDEX_PATH):
+    """
+    [(file path, class name)] for every Scene subclass, found by reading the
+    class statements only. Parsed classes are cached per file in index_path,
+    so a warm lookup is a stat() per file and no imports at all.
+    A class counts as a scene if one of its bases is a manim scene class or
+    another scene found here (e.g. MeruSierpinskiReveal(MeruEpicReveal)).
+    """
+    root = Path(root)
+    cached = _load_index(index_path)
+    files = {}
+    for path in scene_files(root):
+        stamp = _file_stamp(path)
+        entry = cached.get(path.name)
+        if entry is None or entry["stamp"] != stamp:
+            try:
+                classes = class_bases(path)
+            except (SyntaxError, UnicodeDecodeError):
+                classes = []
+            entry = {"stamp": stamp, "classes": classes}
+        files[path.name] = entry
+    if files != cached:
+        _save_index(index_path, files)
+
+    # Scene-ness follows inheritance across files, by class name
+    scenes = set(MANIM_SCENE_BASES)
+    changed = True
+    while changed:
+        changed = False
+        for entry in files.values():
+            for name, bases in entry["classes"]:
+                if name not in scenes and scenes.intersection(bases):
+                    scenes.add(name)
+                    changed = True
+
+    return [
+        (root / file_name, name)
+        for file_name, entry in files.items()
+        for name, bases in entry["classes"]
+        if name not in MANIM_SCENE_BASES and scenes.intersection(bases)
+    ]
@@ -0,0 +1,205 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+
+Opt-in profiler for scenes. Mix it in before Scene:
+
+    class MeruPrastaraCompact(ProfiledScene, Scene): ...
+
+and render with MATHRIZE_PROFILE=1 (or set profile = True on the class).
+Every play/wait gets one record: wall time split into construct (Python
+between plays), interpolate, render and encode, the mobject family and
+point counts, and Python allocations. Output goes to <profile_dir>:
+
+    <Scene>.trace.json   records + totals
+    <Scene>.folded       collapsed stacks for flamegraph.pl / speedscope
+
+When profiling is off, play and wait only check one attribute.
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+PROFILE_ENV = "MATHRIZE_PROFILE"
+PROFILE_DIR_ENV = "MATHRIZE_PROFILE_DIR"
+DEFAULT_PROFILE_DIR = Path("media") / "profiles"
+
+# Time buckets filled by the wrapped scene / renderer methods
+_BUCKETS = ("interpolate", "render", "encode")
+
+
+def profiling_enabled():
+    return os.environ.get(PROFILE_ENV, "") not in ("", "0")
+
+
+def _animation_label(args):
+    names = [type(arg).__name__.lstrip("_") for arg in args]
+    return "+".join(names) or "Wait"
+
+
+def _point_count(family):
+    return int(sum(len(m.points) for m in family if hasattr(m, "points")))
+
+
+class _SceneProfiler:
+    def __init__(self, scene, allocations=True):
+        self.scene = scene
+        self.records = []
+        self.depth = 0
+        self.buckets = dict.fromkeys(_BUCKETS, 0.0)
+        self.allocations = allocations
+        self.started_tracing = False
+        if allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+        self.t_start = self.t_last = time.perf_counter()
+        self._wrap(scene, "update_to_time", "interpolate")
+        self._wrap(scene.renderer, "update_frame", "render")
+        self._wrap(scene.renderer, "add_frame", "encode")
+
+    def _wrap(self, owner, name, bucket):
+        # Instance attribute shadows the method, only on profiled scenes
+        method = getattr(owner, name, None)
+        if method is None:
+            return
+        buckets = self.buckets
+
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                buckets[bucket] += time.perf_counter() - t0
+
+        setattr(owner, name, timed)
+
+    @contextmanager
+    def call(self, kind, args):
+        # wait() goes through play(); only the outermost call is recorded
+        if self.depth:
+            yield
+            return
+        self.depth += 1
+        t0 = time.perf_counter()
+        construct = t0 - self.t_last
+        for bucket in _BUCKETS:
+            self.buckets[bucket] = 0.0
+        blocks0 = sys.getallocatedblocks()
+        if self.allocations:
+            traced0 = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            t1 = time.perf_counter()
+            family = self.scene.get_mobject_family_members()
+            record = {
+                "index": len(self.records),
+                "kind": kind,
+                "label": "Wait" if kind == "wait" else _animation_label(args),
+                "start_s": t0 - self.t_start,
+                "construct_s": construct,
+                "call_s": t1 - t0,
+                **{bucket + "_s": self.buckets[bucket] for bucket in _BUCKETS},
+                "family": len(family),
+                "points": _point_count(family),
+                "alloc_blocks": sys.getallocatedblocks() - blocks0,
+            }
+            record["other_s"] = record["call_s"] - sum(self.buckets.values())
+            if self.allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                record["alloc_net_bytes"] = current - traced0
+                record["alloc_peak_bytes"] = peak - traced0
+            self.records.append(record)
+            self.t_last = time.perf_counter()
+
+    def folded(self, name):
+        """Collapsed stacks, one line per frame path, weights in microseconds."""
+        lines = []
+
+        def add(stack, seconds):
+            weight = int(round(seconds * 1e6))
+            if weight > 0:
+                lines.append("{} {}".format(";".join(stack), weight))
+
+        for record in self.records:
+            add([name, "construct"], record["construct_s"])
+            frame = "{}#{}:{}".format(record["kind"], record["index"], record["label"])
+            for bucket in _BUCKETS + ("other",):
+                add([name, frame, bucket], record[bucket + "_s"])
+        add([name, "construct"], time.perf_counter() - self.t_last)
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory, name):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        wall = time.perf_counter() - self.t_start
+        totals = {key: sum(r[key] for r in self.records)
+                  for key in ("construct_s", "call_s") + tuple(b + "_s" for b in _BUCKETS + ("other",))}
+        trace = {
+            "scene": name,
+            "wall_s": wall,
+            "calls": len(self.records),
+            "totals": totals,
+            "family_peak": max((r["family"] for r in self.records), default=0),
+            "points_peak": max((r["points"] for r in self.records), default=0),
+            "records": self.records,
+        }
+        (directory / "{}.trace.json".format(name)).write_text(json.dumps(trace, indent=2))
+        (directory / "{}.folded".format(name)).write_text(self.folded(name))
+        if self.started_tracing:
+            tracemalloc.stop()
+        return directory / "{}.trace.json".format(name)
+
+
+class ProfiledScene:
+    """Mixin for Scene subclasses; see the module docstring."""
+
+    # None: follow the MATHRIZE_PROFILE environment variable
+    profile = None
+    profile_allocations = True
+    profile_dir = None
+    profile_name = None
+
+    _profiler = None
+
+    def setup(self):
+        super().setup()
+        enabled = profiling_enabled() if self.profile is None else self.profile
+        if enabled:
+            self._profiler = _SceneProfiler(self, self.profile_allocations)
+
+    def play(self, *args, **kwargs):
+        if self._profiler is None:
+            return super().play(*args, **kwargs)
+        with self._profiler.call("play", args):
+            return super().play(*args, **kwargs)
+
+    def wait(self, *args, **kwargs):
+        if self._profiler is None:
+            return super().wait(*args, **kwargs)
+        with self._profiler.call("wait", args):
+            return super().wait(*args, **kwargs)
+
+    def tear_down(self):
+        super().tear_down()
+        if self._profiler is not None:
+            directory = self.profile_dir or os.environ.get(PROFILE_DIR_ENV) or DEFAULT_PROFILE_DIR
+            path = self._profiler.write(directory, self.profile_name or type(self).__name__)
+            self._profiler = None
+            print("Profile written to {}".format(path))
+
+
+def profiled(scene_cls, **options):
+    """Profiled subclass of an existing scene, e.g. profiled(GaltonBoardMeru, profile_dir="out")."""
+    attrs = dict(options)
+    attrs.setdefault("profile", True)
+    return type(scene_cls.__name__, (ProfiledScene, scene_cls), attrs)
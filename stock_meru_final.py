@@ -7,8 +7,21 @@ YouTube: https://www.youtube.com/@MathRize
 from manim import *
 import random
 import numpy as np
+from binomial_dist import normal_approx, pmf_comparison
+from crr_pricing import convergence, crr_price
+from edge_set import EdgeSet, GrowEdges
+from meru_lattice import BinomialLattice
+from price_series import load_price_series, lttb, pixel_budget
 
 class StockMeruFinal(Scene):
+    # Size knob: number of up/down steps in the Meru tree
+    steps = 5
+    # Largest N the exact bell curve grows to in the last part
+    overlay_max_steps = 10**6
+    # Optional real history (CSV or NPY, any size) instead of the synthetic walk
+    price_file = None
+    price_column = "close"
+
     def construct(self):
         # --- CINEMATIC CONFIGURATION ---
         BG_COLOR = "#000814"
@@ -37,18 +50,33 @@ class StockMeruFinal(Scene):
         labels = VGroup(x_label, y_label)
 
         # 2. Generate Random Stock Path
-        start_price = 60
-        prices = [start_price]
-        np.random.seed(42) 
-        for _ in range(6):
-            change = np.random.uniform(-5, 7) 
-            next_price = prices[-1] + change
-            prices.append(next_price)
+        if self.price_file:
+            # Real history: memory-mapped, then LTTB down to one point per pixel column
+            series = load_price_series(self.price_file, column=self.price_column)
+            keep = lttb(series, pixel_budget(axes.x_length, config.frame_width, config.pixel_width))
+            times = 6 * keep / max(len(series) - 1, 1)
+            raw = np.asarray(series[keep], dtype=float)
+            # Fit the price range inside the axes (40 - 80) with a small margin
+            prices = 42 + 36 * (raw - raw.min()) / max(np.ptp(raw), 1e-12)
+            start_price = prices[0]
+        else:
+            start_price = 60
+            prices = [start_price]
+            np.random.seed(42) 
+            for _ in range(6):
+                change = np.random.uniform(-5, 7) 
+                next_price = prices[-1] + change
+                prices.append(next_price)
+            times = np.arange(len(prices))
         
+        # Axes are linear, so map all points at once: origin + x * unit_x + y * unit_y
+        chart_origin = axes.coords_to_point(0, 40)
+        unit_x = axes.coords_to_point(1, 40) - chart_origin
+        unit_y = axes.coords_to_point(0, 41) - chart_origin
+        chart_points = chart_origin + np.outer(times, unit_x) + np.outer(np.asarray(prices, dtype=float) - 40, unit_y)
+
         stock_line = VMobject(color=STOCK_NEON, stroke_width=3)
-        stock_line.set_points_as_corners(
-            [axes.coords_to_point(i, p) for i, p in enumerate(prices)]
-        )
+        stock_line.set_points_as_corners(chart_points)
         stock_line.set_glow_factor(0.5)
 
         # Animate Stock Chart
@@ -62,42 +90,30 @@ class StockMeruFinal(Scene):
 
         # --- PART 2: THE MERU PRASTARA OVERLAY ---
         
-        tree_group = VGroup()
         nodes_group = VGroup()
-        terminal_nodes_data = {} 
         
-        steps = 5 
+        steps = self.steps
+        lattice = BinomialLattice(steps)
         start_point = axes.coords_to_point(0, start_price)
         start_node = Dot(start_point, color=MERU_GOLD, radius=0.08).set_glow_factor(1)
         
-        def build_tree_visuals(current_point, current_step):
-            if current_step >= steps:
-                return
-
-            dx = 1.4  
-            dy = 0.6  
-            
-            next_up = current_point + np.array([dx, dy, 0])
-            next_down = current_point + np.array([dx, -dy, 0])
-
-            line_up = Line(current_point, next_up, color=MERU_GOLD, stroke_width=2).set_opacity(0.7)
-            line_down = Line(current_point, next_down, color=MERU_GOLD, stroke_width=2).set_opacity(0.7)
-            tree_group.add(line_up, line_down)
+        # Tree fills the same 7 x 6 box for any number of steps
+        dx = 7 / steps
+        dy = 3 / steps
+        node_radius = min(0.05, 0.25 / steps)
 
-            node_up = Dot(next_up, color=MERU_GOLD, radius=0.05)
-            node_down = Dot(next_down, color=MERU_GOLD, radius=0.05)
-            nodes_group.add(node_up, node_down)
-            
-            if current_step == steps - 1:
-                y_key = round(next_up[1], 2)
-                terminal_nodes_data[y_key] = next_up
-                y_key_down = round(next_down[1], 2)
-                terminal_nodes_data[y_key_down] = next_down
+        # Recombining lattice: every edge is a subpath of one EdgeSet, growing step by step
+        tree_group = EdgeSet(
+            lattice.edge_segments(start_point, dx, dy), color=MERU_GOLD, opacity=0.7, stroke_width=2,
+            order=lattice.edge_steps(), lag_ratio=0.5
+        )
 
-            build_tree_visuals(next_up, current_step + 1)
-            build_tree_visuals(next_down, current_step + 1)
+        def build_tree_visuals():
+            # Every (step, ups) node is drawn exactly once
+            positions = lattice.node_positions(start_point, dx, dy)
+            for pos in positions[1:]:
+                nodes_group.add(Dot(pos, color=MERU_GOLD, radius=node_radius))
 
-        
         # ERROR FIX: 'FadeOut' opacity error fixed by using '.animate.set_opacity'
         self.play(
             stock_line.animate.set_opacity(0.2), # Dim the line instead of fading out incorrectly
@@ -110,10 +126,10 @@ class StockMeruFinal(Scene):
         overlay_title.next_to(axes, UP, buff=0.5)
         self.play(Write(overlay_title))
 
-        build_tree_visuals(start_point, 0)
+        build_tree_visuals()
         
         self.play(
-            Create(tree_group, lag_ratio=0.1),
+            GrowEdges(tree_group),
             GrowFromCenter(nodes_group, lag_ratio=0.1),
             run_time=3,
             rate_func=smooth
@@ -121,19 +137,19 @@ class StockMeruFinal(Scene):
 
         # --- PART 3: THE REVEAL (Pascal Numbers) ---
         
-        sorted_y_keys = sorted(terminal_nodes_data.keys(), reverse=True)
-        pascal_values = [1, 5, 10, 10, 5, 1] 
+        pascal_values = lattice.terminal_counts()
+        label_size = min(18, 90 / steps)
         
         numbers_group = VGroup()
 
-        for i, y_key in enumerate(sorted_y_keys):
-            if i < len(pascal_values):
-                pos = terminal_nodes_data[y_key]
-                val = pascal_values[i]
-                
-                num_text = Text(str(val), color=MERU_GOLD, font_size=18, font="Georgia")
-                num_text.next_to(pos, RIGHT, buff=0.2)
-                numbers_group.add(num_text)
+        # Top terminal node (all ups) first, matching the old top-to-bottom order
+        for ups in range(steps, -1, -1):
+            pos = lattice.node_position(start_point, steps, ups, dx, dy)
+            val = pascal_values[ups]
+            
+            num_text = Text(str(val), color=MERU_GOLD, font_size=label_size, font="Georgia")
+            num_text.next_to(pos, RIGHT, buff=0.2)
+            numbers_group.add(num_text)
             
         final_label = Text("Probabilities (Bell Curve)", font_size=18, color=STOCK_NEON)
         final_label.to_edge(DOWN, buff=0.5)
@@ -143,6 +159,206 @@ class StockMeruFinal(Scene):
             FadeIn(final_label),
             nodes_group.animate.set_glow_factor(0.8).set_color(STOCK_NEON)
         )
-        
+        self.wait(1)
+
+        # --- PART 4: EXACT BELL CURVE (log-space binomial, N up to 10^6) ---
+        # Drawn sideways to the right of the terminal nodes, in standard units z,
+        # scaled so that at N = steps the exact PMF points sit level with the nodes.
+        ERROR_COLOR = "#FF4D6D"
+        bell_x = start_point[0] + 7 + 0.9
+        bell_width = 1.6
+        z_scale = np.sqrt(steps / 4) * 2 * dy
+        z_grid = np.linspace(-3.5, 3.5, 141)
+
+        log_n = ValueTracker(np.log10(steps))
+
+        def current_n():
+            return int(round(10 ** log_n.get_value()))
+
+        def bell_points(z, values, peak):
+            return np.stack([bell_x + bell_width * values / peak, start_point[1] + z * z_scale, np.zeros(len(z))], axis=1)
+
+        # One PMF comparison per distinct N, shared by the curves and the label
+        comparisons = {}
+
+        def current_comparison():
+            n = current_n()
+            if n not in comparisons:
+                comparisons.clear()
+                comparisons[n] = pmf_comparison(n, max_points=300)
+            return comparisons[n]
+
+        def build_bell():
+            n = current_n()
+            cmp = current_comparison()
+            peak = cmp["exact"].max()
+            sigma = np.sqrt(n / 4)
+            keep = np.abs(cmp["z"]) <= 3.5
+
+            exact_curve = VMobject(color=MERU_GOLD, stroke_width=3)
+            exact_curve.set_points_as_corners(bell_points(cmp["z"][keep], cmp["exact"][keep], peak))
+
+            normal_values = normal_approx(n, n / 2 + z_grid * sigma)
+            normal_curve = VMobject(color=STOCK_NEON, stroke_width=2, stroke_opacity=0.8)
+            normal_curve.set_points_as_corners(bell_points(z_grid, normal_values, peak))
+
+            # Error drawn relative to its own size; its true size is in the label
+            error = cmp["error"][keep]
+            error_gain = 0.5 * peak / max(np.abs(error).max(), 1e-300)
+            error_curve = VMobject(color=ERROR_COLOR, stroke_width=2)
+            error_curve.set_points_as_corners(bell_points(cmp["z"][keep], error * error_gain, peak))
+            return VGroup(error_curve, normal_curve, exact_curve)
+
+        def error_parts():
+            # max |exact - normal| as mantissa and exponent, e.g. 3.2e-05 -> (3.2, -5)
+            mantissa, exponent = f"{current_comparison()['max_abs_error']:.1e}".split("e")
+            return float(mantissa), int(exponent)
+
+        # Static text is set once; only the numbers change per frame (no Pango in the loop)
+        n_prefix = Text("N = ", font_size=16, color=MERU_GOLD)
+        n_value = Integer(self.overlay_max_steps, font_size=16, color=MERU_GOLD)
+        error_prefix = Text("max |exact - normal| = ", font_size=14, color=ERROR_COLOR)
+        error_mantissa = DecimalNumber(9.9, num_decimal_places=1, font_size=14, color=ERROR_COLOR)
+        error_e = Text("e", font_size=14, color=ERROR_COLOR)
+        error_exponent = Integer(-10, font_size=14, color=ERROR_COLOR)
+        # Laid out with the widest values, so the label never runs off the edge
+        bell_label = VGroup(
+            VGroup(n_prefix, n_value).arrange(RIGHT, buff=0.05),
+            VGroup(error_prefix, error_mantissa, error_e, error_exponent).arrange(RIGHT, buff=0.05),
+        ).arrange(DOWN, aligned_edge=LEFT, buff=0.1)
+        bell_label.next_to(axes, UP, buff=0.2).to_edge(RIGHT, buff=0.3)
+
+        def update_bell_label(label):
+            n_value.set_value(current_n()).next_to(n_prefix, RIGHT, buff=0.05)
+            mantissa, exponent = error_parts()
+            error_mantissa.set_value(mantissa).next_to(error_prefix, RIGHT, buff=0.05)
+            error_e.next_to(error_mantissa, RIGHT, buff=0.05)
+            error_exponent.set_value(exponent).next_to(error_e, RIGHT, buff=0.05)
+
+        update_bell_label(bell_label)
+        bell_label.add_updater(update_bell_label)
+        bell = always_redraw(build_bell)
+
+        self.play(Create(bell), FadeIn(bell_label), run_time=1.5)
+        # Log-space math: each frame recomputes the exact PMF in milliseconds
+        self.play(
+            log_n.animate.set_value(np.log10(self.overlay_max_steps)),
+            numbers_group.animate.set_opacity(0.2),
+            run_time=5,
+            rate_func=smooth
+        )
 
         self.wait(4)
+
+
+class StockMeruOptionPricing(Scene):
+    # Size knobs: lattice steps drawn, largest N in the convergence plot
+    steps = 6
+    max_convergence_steps = 400
+    # American put on the same Meru lattice (Cox-Ross-Rubinstein)
+    S0 = 60
+    K = 60
+    T = 1.0
+    r = 0.05
+    sigma = 0.3
+
+    def construct(self):
+        # --- CINEMATIC CONFIGURATION ---
+        BG_COLOR = "#000814"
+        self.camera.background_color = BG_COLOR
+
+        STOCK_NEON = "#00FFAA"
+        MERU_GOLD = "#FFD700"
+        AXIS_COLOR = "#334455"
+        COLD_COLOR = "#1B2A49"
+        HOT_COLOR = "#FF4D6D"
+
+        title = Text("Pricing on the Meru: Cox-Ross-Rubinstein", font_size=22, color=MERU_GOLD).to_edge(UP, buff=0.4)
+        self.play(Write(title))
+
+        # --- PART 1: OPTION VALUES ON THE LATTICE (heatmap) ---
+        steps = self.steps
+        lattice = BinomialLattice(steps)
+        price, tree = crr_price(
+            self.S0, self.K, self.T, self.r, self.sigma, steps,
+            kind="put", style="american", return_tree=True
+        )
+
+        start_point = np.array([-6.2, -0.4, 0])
+        dx = 5.4 / steps
+        dy = 2.6 / steps
+
+        edges = EdgeSet(
+            lattice.edge_segments(start_point, dx, dy), color=MERU_GOLD, opacity=0.4, stroke_width=1.5,
+            order=lattice.edge_steps(), lag_ratio=0.5
+        )
+
+        node_values = np.concatenate(tree)
+        hottest = max(node_values.max(), 1e-12)
+        nodes = VGroup()
+        value_labels = VGroup()
+        for (step, ups), pos, value in zip(lattice.nodes(), lattice.node_positions(start_point, dx, dy), node_values):
+            color = interpolate_color(ManimColor(COLD_COLOR), ManimColor(HOT_COLOR), value / hottest)
+            nodes.add(Dot(pos, radius=min(0.09, 0.5 / steps), color=color))
+            if steps <= 8:
+                value_labels.add(Text(f"{value:.1f}", font_size=12, color=GRAY_B).next_to(pos, UP, buff=0.05))
+
+        price_label = Text(f"American put = {float(price):.3f}", font_size=18, color=HOT_COLOR)
+        price_label.next_to(nodes, DOWN, buff=0.4)
+
+        self.play(GrowEdges(edges), run_time=1.5)
+        # Backward induction: colour flows from the last column to the root
+        self.play(
+            LaggedStart(*[FadeIn(dot, scale=1.5) for dot in reversed(nodes)], lag_ratio=0.02),
+            FadeIn(value_labels),
+            run_time=2.5
+        )
+        self.play(Write(price_label))
+        self.wait(1)
+
+        # --- PART 2: CONVERGENCE TO BLACK-SCHOLES ---
+        # European put, priced for every N up front (O(N) each), then only drawn
+        ns, crr_prices, bs_price = convergence(
+            self.S0, self.K, self.T, self.r, self.sigma,
+            range(1, self.max_convergence_steps + 1), kind="put"
+        )
+        settled = crr_prices[min(4, len(crr_prices) - 1):]
+        spread = max(np.abs(settled - bs_price).max(), 1e-3)
+
+        conv_axes = Axes(
+            x_range=[0, self.max_convergence_steps, self.max_convergence_steps // 4],
+            y_range=[bs_price - 1.2 * spread, bs_price + 1.2 * spread, spread],
+            x_length=5.5,
+            y_length=3.5,
+            axis_config={"color": AXIS_COLOR, "stroke_width": 2, "include_tip": False},
+            x_axis_config={"font_size": 16},
+            tips=False,
+        ).to_edge(RIGHT, buff=0.6).shift(DOWN*0.3)
+        conv_title = Text("CRR price vs N", font_size=16, color=STOCK_NEON).next_to(conv_axes, UP, buff=0.2)
+
+        bs_line = DashedLine(
+            conv_axes.coords_to_point(0, bs_price),
+            conv_axes.coords_to_point(self.max_convergence_steps, bs_price),
+            color=MERU_GOLD, stroke_width=2
+        )
+        bs_label = Text("Black-Scholes", font_size=14, color=MERU_GOLD).next_to(bs_line, DOWN, buff=0.1).align_to(bs_line, RIGHT)
+
+        origin = conv_axes.coords_to_point(0, bs_price)
+        unit_x = conv_axes.coords_to_point(1, bs_price) - origin
+        unit_y = conv_axes.coords_to_point(0, bs_price + 1) - origin
+        clipped = np.clip(crr_prices, bs_price - 1.2 * spread, bs_price + 1.2 * spread)
+        curve_points = origin + np.outer(ns, unit_x) + np.outer(clipped - bs_price, unit_y)
+
+        n_shown = ValueTracker(2)
+
+        def build_curve():
+            count = max(2, int(n_shown.get_value()))
+            return VMobject(color=STOCK_NEON, stroke_width=2).set_points_as_corners(curve_points[:count])
+
+        conv_curve = always_redraw(build_curve)
+
+        self.play(Create(conv_axes), Write(conv_title), Create(bs_line), FadeIn(bs_label))
+        self.add(conv_curve)
+        self.play(n_shown.animate.set_value(len(ns)), run_time=5, rate_func=linear)
+
+        self.wait(3)
@@ -0,0 +1,101 @@
+"""
+Project: The Code of Binary / Meru Prastara Visualization
+Copyright (c) 2026 Ruhani Kashni (MathRize)
+License: MIT License (See LICENSE file for details)
+YouTube: https://www.youtube.com/@MathRize
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Members per chunk. Chunking (and the seed of every chunk) only depends on
+# this number, so a given seed gives the same ensemble for any worker count.
+CHUNK_SIZE = 65536
+
+
+# --- DRIFT MODELS ---
+# A drift model is called as drift(n_steps) and returns per-step drift,
+# shape (n_steps, 2) or anything that broadcasts against it.
+# Models are small classes (not lambdas) so they can be sent to worker processes.
+
+class ConstantDrift:
+    def __init__(self, dx=1.2, dy=0.0):
+        self.velocity = np.array([dx, dy], dtype=float)
+
+    def __call__(self, n_steps):
+        return np.broadcast_to(self.velocity, (n_steps, 2))
+
+
+class CurvingDrift:
+    # Heading turns by `turn` radians every step (storm recurving)
+    def __init__(self, speed=1.2, heading=0.0, turn=0.1):
+        self.speed = speed
+        self.heading = heading
+        self.turn = turn
+
+    def __call__(self, n_steps):
+        angles = self.heading + self.turn * np.arange(n_steps)
+        return self.speed * np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+
+# --- NOISE MODELS ---
+# A noise model is called as noise(rng, shape) with shape (members, steps, 2)
+# and returns the random part of every step in one array call.
+
+class UniformNoise:
+    def __init__(self, low=(0.0, -0.5), high=(0.0, 1.0)):
+        self.low = np.asarray(low, dtype=float)
+        self.high = np.asarray(high, dtype=float)
+
+    def __call__(self, rng, shape):
+        return rng.uniform(self.low, self.high, size=shape)
+
+
+class GaussianNoise:
+    def __init__(self, sigma=(0.0, 0.4), mean=(0.0, 0.0)):
+        self.sigma = np.asarray(sigma, dtype=float)
+        self.mean = np.asarray(mean, dtype=float)
+
+    def __call__(self, rng, shape):
+        return rng.normal(self.mean, self.sigma, size=shape)
+
+
+def _simulate_chunk(n_members, n_steps, start, drift, noise, seed_seq):
+    rng = np.random.default_rng(seed_seq)
+    steps = drift(n_steps) + noise(rng, (n_members, n_steps, 2))
+
+    tracks = np.empty((n_members, n_steps + 1, 2))
+    tracks[:, 0] = start
+    np.cumsum(steps, axis=1, out=tracks[:, 1:])
+    tracks[:, 1:] += start
+    return tracks
+
+
+def generate_ensemble(n_members, n_steps, start=(0.0, 0.0), drift=None, noise=None,
+                      seed=None, workers=None):
+    """
+    Random-walk ensemble as one (n_members, n_steps + 1, 2) array.
+    Track k is start, start + step_1, start + step_1 + step_2, ...
+    With workers > 1, chunks of CHUNK_SIZE members run in a process pool.
+    """
+    drift = ConstantDrift() if drift is None else drift
+    noise = UniformNoise() if noise is None else noise
+    start = np.asarray(start, dtype=float)[:2]
+
+    sizes = [CHUNK_SIZE] * (n_members // CHUNK_SIZE)
+    if n_members % CHUNK_SIZE:
+        sizes.append(n_members % CHUNK_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if workers and workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(
+                _simulate_chunk, sizes, [n_steps] * len(sizes), [start] * len(sizes),
+                [drift] * len(sizes), [noise] * len(sizes), seeds,
+            ))
+    else:
+        chunks = [_simulate_chunk(size, n_steps, start, drift, noise, s) for size, s in zip(sizes, seeds)]
+
+    if not chunks:
+        return np.empty((0, n_steps + 1, 2))
+    return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
@@ -6,8 +6,28 @@ YouTube: https://www.youtube.com/@MathRize
 """
 from manim import *
 import numpy as np
+from edge_set import EdgeSet, GrowEdges
+from ensemble_tracks import load_ensemble_tracks, project_tracks, thin_steps
+from forecast_cone import ConeGeometry, cone_polygons
+from multinomial_engine import branch_moments, multinomial_rows
+from polyline_paths import GrowTracks, TrackPaths
+from weather_ensemble import ConstantDrift, UniformNoise, generate_ensemble
 
 class WeatherMeruCone(Scene):
+    # Size knobs: ensemble members, steps per track, worker processes
+    n_paths = 15
+    path_steps = 5
+    workers = None
+    # Size knob for the cone, and "normal" (smooth) or "binomial" (exact, stepped) bands
+    cone_steps = 5
+    cone_method = "normal"
+    # Branch weights per step: (1, 1) = right turn or not (Meru), (1, 2, 1) = left / straight / right
+    branch_weights = (1, 1)
+    # Optional real ensemble (CSV / ATCF text / NPZ, see ensemble_tracks.py) instead of the
+    # random paths, thinned to at most max_track_steps steps per member
+    track_file = None
+    max_track_steps = 200
+
     def construct(self):
         # --- CINEMATIC CONFIGURATION ---
         BG_COLOR = "#000510" # Deep Ocean/Space Blue
@@ -52,32 +72,34 @@ class WeatherMeruCone(Scene):
         # --- PART 2: THE CHAOS (Simulation Paths) ---
         # Weather supercomputers run 50+ simulations. We show this as "Chaos".
         
-        paths = VGroup()
         start_point = storm_center.get_center()
         
-        # Create 15 random paths fanning out
-        np.random.seed(10)
-        for _ in range(15):
-            # Create a jagged path
-            points = [start_point]
-            curr = start_point
-            for step in range(5):
-                # Move Generally Right and Up, but with randomness
-                dx = 1.2
-                dy = np.random.uniform(-0.5, 1.0) # Bias towards up-right
-                curr = curr + np.array([dx, dy, 0])
-                points.append(curr)
-            
-            path = VMobject().set_points_as_corners(points)
-            path.set_color(PATH_COLOR).set_stroke(width=1, opacity=0.3)
-            paths.add(path)
+        if self.track_file:
+            # Real ensemble, projected so it leaves the storm heading up-right like the cone
+            tracks = project_tracks(
+                thin_steps(load_ensemble_tracks(self.track_file), self.max_track_steps),
+                start_point, extent=(7.0, 3.5), heading=np.arctan2(0.25, 1.2),
+            )
+        else:
+            # Whole ensemble in one array call: (n_paths, path_steps + 1, 2)
+            # Move Generally Right and Up, but with randomness (bias towards up-right)
+            tracks = generate_ensemble(
+                self.n_paths, self.path_steps, start=start_point,
+                drift=ConstantDrift(dx=1.2, dy=0.0),
+                noise=UniformNoise(low=(0.0, -0.5), high=(0.0, 1.0)),
+                seed=10, workers=self.workers,
+            )
+        
+        # One VMobject with a subpath per member, instead of one mobject per path
+        paths = TrackPaths(tracks)
+        paths.set_color(PATH_COLOR).set_stroke(width=1, opacity=min(0.3, 4.5 / len(tracks)))
 
         path_label = Text("Forecasting Models (Chaos)", font_size=18, color=PATH_COLOR).to_edge(UP, buff=1.0)
         
         self.play(
             FadeOut(current_text),
             Write(path_label),
-            Create(paths, lag_ratio=0.1, run_time=3)
+            GrowTracks(paths, run_time=3)
         )
         self.wait(1)
 
@@ -89,70 +111,78 @@ class WeatherMeruCone(Scene):
             FadeOut(path_label)
         )
 
-        meru_group = VGroup()
-        dots_group = VGroup()
-        
-        # Build a visual cone using Meru Logic (5 steps)
-        # We manually place dots to match the storm's trajectory direction (Up-Right)
-        
-        steps = 5
-        # We need to rotate the triangle logic to match the storm path (approx 30 degrees)
-        # Base vector for the grid
-        vec_a = np.array([1.0, 0.4, 0]) # Move Right-ish
-        vec_b = np.array([1.0, -0.2, 0]) # Move Right-Down-ish (widening the cone)
-        
-        # To make it look like a cone, we spread out from start_point
+        # Build the cone with Meru logic: after t steps the storm has taken
+        # k "right-turn" branches with k ~ Binomial(t, 1/2) (Pascal row t).
+        # The bands are the per-step 50/80/95% ranges of k, drawn as polygons.
+        # With K branch weights, row t of (w_0 + ... + w_{K-1} x^{K-1})^t takes
+        # the place of the Meru row and lateral position j is drawn at k = j / (K - 1).
+        
+        steps = self.cone_steps
+        weights = self.branch_weights
+        n_moves = len(weights) - 1
+        step_rows = multinomial_rows(steps, weights)
+        # Forward = one forecast step (right, trending up); lateral = one right-turn branch.
+        # For 5 steps this is the original 1.2 / 0.7 / -0.6 spacing.
+        cone = ConeGeometry(
+            start_point,
+            forward=np.array([6.0, 3.5, 0]) / steps,
+            lateral=np.array([0, -3.0, 0]) / steps,
+        )
         
-        row_5_vals = [1, 5, 10, 10, 5, 1] # Pascal Row 5
-        final_dots = VGroup()
+        band_opacity = {0.95: 0.12, 0.8: 0.2, 0.5: 0.32}
+        bands_group = VGroup()
+        band_labels = VGroup()
+        for level, vertices in cone_polygons(cone, steps, tuple(band_opacity), method=self.cone_method, weights=weights).items():
+            band = Polygon(*vertices, color=CONE_COLOR, stroke_width=1, stroke_opacity=0.5)
+            band.set_fill(CONE_COLOR, opacity=band_opacity[level])
+            bands_group.add(band)
+            # Label at the far end of the band's upper edge
+            label = Text(f"{round(level * 100)}%", font_size=14, color=CONE_COLOR)
+            band_labels.add(label.next_to(vertices[steps], RIGHT, buff=0.1))
+        
+        center_track = VMobject(color=CONE_COLOR, stroke_width=2).set_points_as_corners(cone.centerline(steps, branch_moments(weights)[0]))
 
-        for step in range(steps + 1):
-            # In weather, steps branch out. 
-            # We will just show the outline and the nodes
-            
-            # Create a row of dots
-            for k in range(step + 1):
-                # Position logic: mixture of vec_a and vec_b
-                # P = Start + (step-k)*vec_a + k*vec_b
-                # We adjust vectors to make a nice cone shape
-                
-                # Simplified Cone Logic for Visuals:
-                x_pos = start_point[0] + step * 1.2
-                # y spreads out based on step
-                spread = step * 0.8
-                y_start = start_point[1] + (step * 0.5) # General trend up
-                y_pos = y_start + (k * -0.6) # Spread down
-                
-                # Correction to center the spread
-                y_pos += (spread / 2) * 0.5 # Shift slightly
-                
-                pos = np.array([x_pos, y_pos, 0])
-                
-                dot = Dot(pos, radius=0.06, color=CONE_COLOR)
-                dots_group.add(dot)
-                
-                # If it's the last step, save for numbers
-                if step == steps:
-                    final_dots.add(dot)
-                    
-                # Draw lines connecting to previous (implied grid)
-                if step > 0:
-                   # Visual lines only to show structure
-                   line = Line(start_point, pos, stroke_width=1, color=CONE_COLOR).set_opacity(0.2)
-                   meru_group.add(line)
+        # Meru branches inside the cone, all in one EdgeSet: an edge is as
+        # opaque as its parent node is likely (relative to the most likely node of that step)
+        # Every node (t, j) has one edge per branch, to (t + 1, j + i)
+        edge_t = np.concatenate([np.full(len(step_rows[t]) * (n_moves + 1), t) for t in range(steps)])
+        parent_j = np.concatenate([np.repeat(np.arange(len(step_rows[t])), n_moves + 1) for t in range(steps)])
+        child_j = parent_j + np.tile(np.arange(n_moves + 1), len(parent_j) // (n_moves + 1))
+        branch_segments = np.stack([
+            cone.points(edge_t, parent_j / n_moves), cone.points(edge_t + 1, child_j / n_moves)
+        ], axis=1)
+        edge_weight = np.concatenate([np.repeat(row / row.max(), n_moves + 1) for row in step_rows[:steps]])
+        branches = EdgeSet(
+            branch_segments, color=CONE_COLOR, opacity=0.5 * edge_weight, stroke_width=1,
+            order=edge_t, lag_ratio=0.5
+        )
+        
+        # Final row of the Meru: dot size follows the binomial probability
+        final_probs = step_rows[-1]
+        final_points = cone.points(np.full(len(final_probs), steps), np.arange(len(final_probs)) / n_moves)
+        final_dots = VGroup(*[
+            Dot(pos, radius=0.03 + 0.05 * prob / final_probs.max(), color=CONE_COLOR)
+            for pos, prob in zip(final_points, final_probs)
+        ])
 
         cone_title = Text("The Cone of Uncertainty (Meru Structure)", font_size=18, color=CONE_COLOR).to_edge(UP, buff=1.0)
 
         self.play(
             Write(cone_title),
-            FadeIn(dots_group, lag_ratio=0.1),
-            Create(meru_group, run_time=2)
+            FadeIn(bands_group, lag_ratio=0.3),
+            GrowEdges(branches),
+            Create(center_track),
+            FadeIn(final_dots, lag_ratio=0.1),
+            FadeIn(band_labels),
+            run_time=2
         )
 
         # --- PART 4: THE PROBABILITY (Center is Safest Prediction) ---
         
         # Highlight the center of the final row
-        center_dots = VGroup(final_dots[2], final_dots[3]) # The middle ones (10, 10)
+        last = len(final_probs) - 1
+        middle = sorted({last // 2, (last + 1) // 2})
+        center_dots = VGroup(*[final_dots[k] for k in middle]) # The middle ones (10, 10)
         edge_dots = VGroup(final_dots[0], final_dots[-1])  # The edge ones (1, 1)
         
         # Text for probabilities